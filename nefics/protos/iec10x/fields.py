@@ -5,10 +5,16 @@ from scapy.fields import Field, BitField
 from scapy.packet import Packet
 from scapy.volatile import VolatileValue, RandShort
 from typing import Callable, Optional, Tuple, TypeVar, Any
-from struct import unpack
+from functools import lru_cache
+from struct import error as struct_error
 
 I = TypeVar('I')
 
+@lru_cache(maxsize=4096)
+def _ioa_octets(ioa: int, width: int) -> bytes:
+    '''Little-endian IOA octets; devices keep sending the same few point addresses'''
+    return ioa.to_bytes(3, 'little')[:width]
+
 class IOA(Field):
 
     __slots__ = ['check_balanced']
@@ -25,17 +31,13 @@ class IOA(Field):
     def addfield(self, pkt: Packet, s: bytes, val) -> bytes:
         if val is None:
             return s
-        value : list[int]= []
-        value.append(int(val & 0xff))
-        value.append(int(val & 0xff00) >> 8)
-        if self.check_balanced is not None and not self.check_balanced(pkt):
-            value.append(int(val & 0xff0000) >> 16)
-        return s + bytes(value)
+        return s + _ioa_octets(int(val) & 0xffffff, self.i2len(pkt, val))
 
     def getfield(self, pkt: Packet, s: bytes) -> Tuple[bytes, I]:
-        if self.check_balanced is not None and not self.check_balanced(pkt):
-            return s[3:], self.m2i(pkt, unpack('<I', s[:3] + b'\x00')[0])
-        return s[2:], self.m2i(pkt, unpack('<H', s[:2])[0])
+        width : int = self.i2len(pkt, None)
+        if len(s) < width:
+            raise struct_error(f'IOA needs {width} octets, got {len(s)}')
+        return s[width:], self.m2i(pkt, int.from_bytes(s[:width], 'little'))
     
     def randval(self) -> VolatileValue:
         return RandShort()
@@ -129,8 +129,6 @@ class IEC104Handler(DeviceHandler):
             try:
                 sleep(TIMEOUT_T2)
                 for addr in self._mem_map:
-                    apdu : APDU = APDU()
-                    apdu /= APCI(type=0x00)
                     asdu_type : Optional[int] = None
                     io : Optional[Union[IO30, IO35, IO36]] = None
                     if addr < 0x20000: # Boolean value
@@ -146,14 +144,14 @@ class IEC104Handler(DeviceHandler):
                         asdu_type = 0x24 # Measured value, short floating point number with time tag CP56Time2a
                         io = IO36(_sq=0, _number=1, _balanced=False, IOA=addr, value=value, time=time56())
                     if asdu_type is not None and io is not None:
-                        apdu /= ASDU(
+                        asdu : ASDU = ASDU(
                             type=asdu_type, 
                             VSQ=VSQ(SQ=0, number=1),
                             COT=0x03, # Spontaneous
                             CommonAddress=self._device.guid & 0xFF,
                             IO=[io]
                         )
-                        self._send_queue.put(APDU(apdu.build()))
+                        self._send_queue.put(APDU.from_layers(APCI(type=0x00), asdu))
                     sleep(min(DATATR_WAIT, TIMEOUT_T2/len(self._mem_map)))
             except BrokenPipeError:
                 alive = False
@@ -167,14 +165,15 @@ class IEC104Handler(DeviceHandler):
                 if len(buffer) > 0:
                     apdu : APDU = APDU(buffer)
                     assert apdu.haslayer('APCI'), f'Malformed frame: {bytes(buffer)}'
-                    self._recv_queue.put(APDU(buffer), block=True, timeout=TIMEOUT_T2)
-                    if apdu['APCI'].type == 0x00: # I-frame
+                    apci : APCI = apdu['APCI']
+                    self._recv_queue.put(apdu, block=True, timeout=TIMEOUT_T2)
+                    if apci.type == 0x00: # I-frame
                         self.rx += 1
-                    if apdu['APCI'].type == 0x01: # S-frame
-                        if apdu['APCI'].Rx != self.tx:
-                            stderr.write(f'Sequence error ({apdu["APCI"].Rx} != {self.tx}) -- Synchronizing\r\n')
+                    if apci.type == 0x01: # S-frame
+                        if apci.Rx != self.tx:
+                            stderr.write(f'Sequence error ({apci.Rx} != {self.tx}) -- Synchronizing\r\n')
                             stderr.flush()
-                            self.tx = apdu['APCI'].Rx
+                            self.tx = apci.Rx
                 else:
                     sleep(EMPTY_WAIT)
             except Full:
@@ -196,10 +195,11 @@ class IEC104Handler(DeviceHandler):
             try:
                 if not self._send_queue.empty():
                     next_apdu : APDU = self._send_queue.get(block=False)
-                    if next_apdu['APCI'].type < 3:
-                        next_apdu['APCI'].Rx = self.rx
-                    if next_apdu['APCI'].type == 0:
-                        next_apdu['APCI'].Tx = self.tx
+                    apci : APCI = next_apdu['APCI']
+                    if apci.type < 3:
+                        apci.Rx = self.rx
+                    if apci.type == 0:
+                        apci.Tx = self.tx
                     self._sock.send(next_apdu.build())
                     self.tx += 1
                 elif self._send_queue.empty() and self._state == ControlledState.PENDING:
@@ -214,7 +214,7 @@ class IEC104Handler(DeviceHandler):
         # Respond with specific CoT
         asdu : ASDU = apdu['ASDU']
         rasdu : ASDU = ASDU(type=asdu.type, VSQ=asdu.VSQ, COT_flags=0b01, COT=cot, CommonAddress=asdu.CommonAddress, IO=asdu.IO)
-        self._send_queue.put(APDU()/APCI(type=0x00)/rasdu, block=True, timeout=TIMEOUT_T2)
+        self._send_queue.put(APDU.from_layers(APCI(type=0x00), rasdu), block=True, timeout=TIMEOUT_T2)
 
     def _handle_IO45_IO58(self, apdu : APDU):
         'Handle C_SC_NA_1 (Single command) and C_SC_TA_1 (Single command with time tag CP56Time2a)'
@@ -254,7 +254,7 @@ class IEC104Handler(DeviceHandler):
             io = IO58(_sq=0, _number=1, _balanced=False, IOA=ioa, SE=int(select), SCS=int(scs), time=currtime)
             atype = 0x3a
         asdu = ASDU(type=atype, VSQ=vsq, COT_flags=cot_flags, COT=cot, CommonAddress=self._device.guid, IO=io)
-        self._send_queue.put(APDU()/APCI(type=0x00)/asdu)
+        self._send_queue.put(APDU.from_layers(APCI(type=0x00), asdu))
 
     def _handle_IO46_IO59(self, apdu : APDU):
         'Handle C_DC_NA_1 (Double command) and C_DC_TA_1 (Double command with time tag CP56Time2a)'
@@ -298,7 +298,7 @@ class IEC104Handler(DeviceHandler):
             io = IO59(_sq=0, _number=1, _balanced=False, IOA=ioa, SE=int(select), DCS=dcs, time=currtime)
             atype = 0x3b
         asdu = ASDU(type=atype, VSQ=vsq, COT_flags=cot_flags, COT=cot, CommonAddress=self._device.guid, IO=io)
-        self._send_queue.put(APDU()/APCI(type=0x00)/asdu)
+        self._send_queue.put(APDU.from_layers(APCI(type=0x00), asdu))
 
     def _handle_IO49_IO62(self, apdu : APDU):
         'Handle C_SE_NB_1 (Set-point command, scaled value) and C_SE_TB_1 (Set point command, scaled value with time tag CP56Time2a)'
@@ -338,7 +338,7 @@ class IEC104Handler(DeviceHandler):
             io = IO62(_sq=0, _number=1, _balanced=False, IOA=ioa, SVA=value, SE=int(select), time=currtime)
             atype=0x3e
         asdu = ASDU(type=atype, VSQ=vsq, COT_flags=cot_flags, COT=cot, CommonAddress=self._device.guid, IO=io)
-        self._send_queue.put(APDU()/APCI(type=0x00)/asdu)
+        self._send_queue.put(APDU.from_layers(APCI(type=0x00), asdu))
 
     def _handle_IO50_IO63(self, apdu : APDU):
         'Handle C_SE_NC_1 (set point command, short floating point number) and C_SE_TC_1 (Set-point command with time tag CP56Time2a, short floating point number)'
@@ -378,7 +378,7 @@ class IEC104Handler(DeviceHandler):
             io = IO63(_sq=0, _number=1, _balanced=False, IOA=ioa, value=value, SE=int(select), time=currtime)
             atype=0x3F
         asdu = ASDU(type=atype, VSQ=vsq, COT_flags=cot_flags, COT=cot, CommonAddress=self._device.guid, IO=io)
-        self._send_queue.put(APDU()/APCI(type=0x00)/asdu)
+        self._send_queue.put(APDU.from_layers(APCI(type=0x00), asdu))
 
     def _handle_IO100(self, apdu : APDU):
         'Handle C_IC_NA_1 (Interrogation Command)'
@@ -387,7 +387,7 @@ class IEC104Handler(DeviceHandler):
         oio = asdu.IO
         # Add IC (actcon) to the message queue
         rasdu = ASDU(type=100, VSQ=VSQ(SQ=0, number=1), COT_flags=0b00, COT=7, CommonAddress=device.guid & 0xFF, IO=IO100(_sq=0, _number=1, _balanced=False, IOA=0, QOI=oio.QOI))
-        self._send_queue.put(APDU()/APCI(type=0x00)/rasdu, block=True, timeout=TIMEOUT_T2)
+        self._send_queue.put(APDU.from_layers(APCI(type=0x00), rasdu), block=True, timeout=TIMEOUT_T2)
         sleep(ICMD_WAIT)
         # Add process information
         for addr in self._mem_map:
@@ -407,11 +407,11 @@ class IEC104Handler(DeviceHandler):
                 io = IO13(_sq=0, _number=1, _balanced=False, IOA=addr, value=ShortFloat(value=value))
             if asdu_type is not None and io is not None:
                 rasdu = ASDU(type=asdu_type, VSQ=VSQ(SQ=0, number=1), COT=0x14, CommonAddress=device.guid & 0xFF, IO=[io])
-                self._send_queue.put(APDU()/APCI(type=0x00)/rasdu, block=True, timeout=TIMEOUT_T2)
+                self._send_queue.put(APDU.from_layers(APCI(type=0x00), rasdu), block=True, timeout=TIMEOUT_T2)
             sleep(min(ICMD_WAIT, TIMEOUT_T2/len(self._mem_map)))
         # Add IC (actterm) to the message queue
         rasdu = ASDU(type=100, VSQ=VSQ(SQ=0, number=1), COT_flags=0b00, COT=10, CommonAddress=device.guid & 0xFF, IO=IO100(_sq=0, _number=1, _balanced=False, IOA=0, QOI=oio.QOI))
-        self._send_queue.put(APDU()/APCI(type=0x00)/rasdu, block=True, timeout=TIMEOUT_T2)
+        self._send_queue.put(APDU.from_layers(APCI(type=0x00), rasdu), block=True, timeout=TIMEOUT_T2)
 
     def _handle_IO102(self, apdu : APDU):
         'Handle C_RD_NA_1 (Read command)'
@@ -433,7 +433,7 @@ class IEC104Handler(DeviceHandler):
             io = IO36(_sq=0, _number=1, _balanced=False, IOA=req_addr, value=value, time=time56())
         if asdu_type is not None and io is not None:
             res_asdu = ASDU(type=asdu_type, VSQ=VSQ(SQ=0, number=1), COT_flags=0b00, COT=5, CommonAddress=device.guid & 0xFF, IO=io)
-            self._send_queue.put(APDU()/APCI(type=0x00)/res_asdu, block=True, timeout=TIMEOUT_T2)
+            self._send_queue.put(APDU.from_layers(APCI(type=0x00), res_asdu), block=True, timeout=TIMEOUT_T2)
 
     def _handle_iframe(self, apdu : APDU):
         atype : int = apdu['ASDU'].type
@@ -470,7 +470,7 @@ class IEC104Handler(DeviceHandler):
                     if self._state == ControlledState.STOPPED:
                         if apci.type == 0x03: # Received a U-frame
                             utype = apci.UType
-                            self._send_queue.put(APDU()/APCI(type=0x03, UType=(utype << 1)))
+                            self._send_queue.put(APDU.from_layers(APCI(type=0x03, UType=(utype << 1))))
                             if utype == 0x01: # STARTDT
                                 self._state = ControlledState.STARTED
                                 datatr = Thread(target=self._data_transfer)
@@ -500,7 +500,7 @@ class IEC104Handler(DeviceHandler):
                             continue # Synchronization handled by the receiver. Do nothing.
                         else: # U-frame
                             utype = apci.UType
-                            self._send_queue.put(APDU()/APCI(type=0x03, UType=(utype << 1)))
+                            self._send_queue.put(APDU.from_layers(APCI(type=0x03, UType=(utype << 1))))
                             if utype == 0x04: # STOPDT
                                 if self._send_queue.empty() and self._recv_queue.empty():
                                     self._state = ControlledState.STOPPED
@@ -630,14 +630,14 @@ class IEC104CLI(Cmd):
 
     def _keep_alive(self):
         while self._alive and not self._end_conn:
-            self._tx_queue.put(APDU()/APCI(type=0x03, UType=0x10))
+            self._tx_queue.put(APDU.from_layers(APCI(type=0x03, UType=0x10)))
             sleep(TIMEOUT_T2)
             
     def do_disconnect(self, arg : Optional[str]):
         try:
             assert self._alive
             print(f'Stopping data transmission ...', end=' ')
-            self._tx_queue.put(APDU()/APCI(type=0x03, UType=0x04), block=False)
+            self._tx_queue.put(APDU.from_layers(APCI(type=0x03, UType=0x04)), block=False)
             sleep(STOPDT_WAIT)
             print('OK')
             print(f'Closing connection ...', end=' ')
@@ -690,7 +690,7 @@ class IEC104CLI(Cmd):
                 self._rth.start()
                 print('OK')
                 print(f'Starting data transmission ...', end=' ')
-                self._tx_queue.put(APDU()/APCI(type=0x03, UType=0x01), block=False)
+                self._tx_queue.put(APDU.from_layers(APCI(type=0x03, UType=0x01)), block=False)
                 sleep(STOPDT_WAIT)
                 print(f'OK')
                 self._kth.start()
@@ -746,7 +746,7 @@ class IEC104CLI(Cmd):
                         CommonAddress=self._device_ca,  # Device Common Address
                         IO=io                           # IO
                     )
-                    apdu : APDU = APDU()/APCI(type=0x00)/asdu # APCI Type 0x00 (I-Frame)
+                    apdu : APDU = APDU.from_layers(APCI(type=0x00), asdu) # APCI Type 0x00 (I-Frame)
                     self._wait_sbo = True
                     self._tx_queue.put(apdu)
                     while self._wait_sbo:
@@ -765,7 +765,7 @@ class IEC104CLI(Cmd):
                         CommonAddress=self._device_ca,  # Device Common Address
                         IO=io                           # IO
                     )
-                    apdu = APDU()/APCI(type=0x00)/asdu  # APCI Type 0x00 (I-Frame)
+                    apdu = APDU.from_layers(APCI(type=0x00), asdu)  # APCI Type 0x00 (I-Frame)
                     self._wait_sbo = True
                     self._tx_queue.put(apdu)
                     while self._wait_sbo:
@@ -806,7 +806,7 @@ class IEC104CLI(Cmd):
                         CommonAddress=self._device_ca,  # Device Common Address
                         IO=io                           # IO
                     )
-                apdu = APDU()/APCI(type=0x00)/asdu      # APCI Type 0x00 (I-Frame)
+                apdu = APDU.from_layers(APCI(type=0x00), asdu)      # APCI Type 0x00 (I-Frame)
                 self._wait_sbo = True
                 self._tx_queue.put(apdu)
                 while self._wait_sbo:
@@ -839,7 +839,7 @@ class IEC104CLI(Cmd):
                         CommonAddress=self._device_ca,  # Device Common Address
                         IO=io                           # IO
                     )
-                apdu = APDU()/APCI(type=0x00)/asdu      # APCI Type 0x00 (I-Frame)
+                apdu = APDU.from_layers(APCI(type=0x00), asdu)      # APCI Type 0x00 (I-Frame)
                 self._wait_sbo = True
                 self._tx_queue.put(apdu)
                 while self._wait_sbo:
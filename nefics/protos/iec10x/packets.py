@@ -2,6 +2,7 @@
 '''Packet definitions for IEC101/104'''
 
 # Global imports
+from struct import Struct
 from typing import Any, Optional
 from scapy.packet import Packet, Padding
 from scapy.fields import (
@@ -21,6 +22,8 @@ from nefics.protos.iec10x.fields import *
 
 # Common IEC-10x Packets: Information Objects, ASDU and internal values
 
+_CP24 : Struct = Struct('<HB')
+
 class CP24Time2a(Packet):
     name = 'CP24Time2a'
     fields_desc = [
@@ -30,6 +33,24 @@ class CP24Time2a(Packet):
         BitField('minute', 0, 6),
     ]
 
+    def do_dissect(self, s: bytes) -> bytes:
+        if len(s) < 3:
+            return super().do_dissect(s)
+        ms, flags = _CP24.unpack_from(s)
+        self.raw_packet_cache_fields = {}
+        self.fields['Milliseconds'] = ms
+        self.fields['IV'] = flags >> 7
+        self.fields['GEN'] = (flags >> 6) & 0x01
+        self.fields['minute'] = flags & 0x3f
+        self.raw_packet_cache = s[:3]
+        self.explicit = 1
+        return s[3:]
+
+    def self_build(self) -> bytes:
+        if self.raw_packet_cache is not None:
+            return self.raw_packet_cache
+        return _CP24.pack(self.Milliseconds & 0xffff, ((self.IV & 0x01) << 7) | ((self.GEN & 0x01) << 6) | (self.minute & 0x3f))
+
     def extract_padding(self, s: bytes):
         return b'', s
 
@@ -66,6 +87,24 @@ class DIQ(IOVal):
         BitEnumField('DPI', 0b11, 2, DPI_ENUM),
     ]
 
+    # Single octet, handled like VSQ: IO3/IO4 carry one DIQ per object
+
+    def do_dissect(self, s: bytes) -> bytes:
+        if not s:
+            return super().do_dissect(s)
+        diq = s[0]
+        self.raw_packet_cache_fields = {}
+        self.fields['quality'] = self.fields_desc[0].m2i(self, diq >> 2)
+        self.fields['DPI'] = diq & 0x03
+        self.raw_packet_cache = s[:1]
+        self.explicit = 1
+        return s[1:]
+
+    def self_build(self) -> bytes:
+        if self.raw_packet_cache is not None:
+            return self.raw_packet_cache
+        return bytes((((int(self.quality) & 0x3f) << 2) | (self.DPI & 0x03),))
+
 class SOF(Packet):
     name = 'Status of file'
     fields_desc = [
@@ -89,6 +128,23 @@ class VSQ(IOVal):
         BitField('number',0x0,7)
     ]
 
+    # SQ and number share a single octet, so shift and mask it directly
+    # instead of walking the generic BitField machinery
+
+    def do_dissect(self, s: bytes) -> bytes:
+        vsq = s[0]
+        self.raw_packet_cache_fields = {}
+        self.fields['SQ'] = vsq >> 7
+        self.fields['number'] = vsq & 0x7f
+        self.raw_packet_cache = s[:1]
+        self.explicit = 1
+        return s[1:]
+
+    def self_build(self) -> bytes:
+        if self.raw_packet_cache is not None:
+            return self.raw_packet_cache
+        return bytes((((self.SQ & 0x01) << 7) | (self.number & 0x7f),))
+
 class StepPosition(IOVal):
     fields_desc=[
         BitField('transient', 0b0, 1),
@@ -316,6 +372,13 @@ class IO3(IO):
     def __init__(self, _pkt: bytes = b"", post_transform: Any = None, _internal: int = 0, _underlayer: Optional[Packet] = None, _sq: int = 0, _number : Optional[int] = None, _balanced: Optional[bool] = None, **fields: Any) -> None:
         super().__init__(_pkt, post_transform, _internal, _underlayer, _sq, _iolen=IO_LEN[0x03], _number=_number, _balanced=_balanced, **fields)
 
+    def self_build(self) -> bytes:
+        # IOA and DIQ are fixed width: join them directly instead of having PacketField build a DIQ clone
+        diq = self.getfieldval('DIQ')
+        if self.raw_packet_cache is not None or not isinstance(diq, DIQ):
+            return super().self_build()
+        return self.fields_desc[0].addfield(self, b'', self.IOA) + diq.self_build()
+
 class IO4(IO):
     name = 'Double-point information with time tag'
     __slots__ = ['sq', 'number', 'iolen', 'balanced']
@@ -328,6 +391,14 @@ class IO4(IO):
     def __init__(self, _pkt: bytes = b"", post_transform: Any = None, _internal: int = 0, _underlayer: Optional[Packet] = None, _sq: int = 0, _number : Optional[int] = None, _balanced: Optional[bool] = None, **fields: Any) -> None:
         super().__init__(_pkt, post_transform, _internal, _underlayer, _sq, _iolen=IO_LEN[0x04], _number=_number, _balanced=_balanced, **fields)
 
+    def self_build(self) -> bytes:
+        # Same as IO3, followed by the three time octets
+        diq = self.getfieldval('DIQ')
+        cptime = self.getfieldval('time')
+        if self.raw_packet_cache is not None or not isinstance(diq, DIQ) or not isinstance(cptime, CP24Time2a):
+            return super().self_build()
+        return self.fields_desc[0].addfield(self, b'', self.IOA) + diq.self_build() + cptime.self_build()
+
 class IO5(IO):
     name = 'Step position information'
     __slots__ = ['sq', 'number', 'iolen', 'balanced']
@@ -1165,6 +1236,8 @@ class IO127(IO):
     def __init__(self, _pkt: bytes = b"", post_transform: Any = None, _internal: int = 0, _underlayer: Optional[Packet] = None, _sq: int = 0, _number : Optional[int] = None, _balanced: Optional[bool] = None, **fields: Any) -> None:
         super().__init__(_pkt, post_transform, _internal, _underlayer, _sq, _iolen=IO_LEN[0x7f], _number=_number, _balanced=_balanced, **fields)
 
+_ASDU_HDR : Struct = Struct('<BBBB')
+
 class ASDU(Packet):
     name = 'ASDU'
     fields_desc = [
@@ -1257,11 +1330,27 @@ class ASDU(Packet):
         ),
     ]
 
+    def self_build(self) -> bytes:
+        # Pack the fixed header in one go. A dissected ASDU goes through Scapy, which only
+        # reuses the raw bytes when none of the nested packets were modified since
+        if self.raw_packet_cache is not None:
+            return super().self_build()
+        vsq = self.getfieldval('VSQ')
+        if not isinstance(vsq, VSQ):
+            return super().self_build()
+        s = _ASDU_HDR.pack(self.type, vsq.self_build()[0], ((int(self.COT_flags) & 0x03) << 6) | (self.COT & 0x3f), self.CommonAddress)
+        return self.get_field('IO').addfield(self, s, self.getfieldval('IO'))
+
     def post_dissect(self, s: bytes) -> bytes:
-        if isinstance(self.IO, IO):
-            io = self.IO
-            nio = io.__class__(io.original, _sq=self.VSQ.SQ, _number=self.VSQ.number)
-            self.IO = nio
+        # Read and replace the IO value directly: going through self.IO would re-evaluate
+        # every MultipleTypeField condition on each access
+        io = self.getfieldval('IO')
+        if isinstance(io, IO):
+            self.fields['IO'] = io.__class__(io.original, _sq=self.VSQ.SQ, _number=self.VSQ.number)
+            self.explicit = 0
+            self.raw_packet_cache = None
+            self.raw_packet_cache_fields = None
+            self.wirelen = None
         return s
 
 # IEC-101 Packets (FT 1.2 Frame format) [IEC-60870-5-101 A.1.2]
@@ -1313,6 +1402,10 @@ class FT12Frame(Packet):
 
 # IEC_104 Packets
 
+_APCI_HDR : Struct = Struct('<BBHH')
+# First control octet -> (type, UType): bit 0 clear is an I-frame, otherwise the two low bits give S or U
+_APCI_CTRL : list[tuple[int, int]] = [(0x00 if not c & 0x01 else c & 0x03, (c & 0xfc) >> 2) for c in range(256)]
+
 class APCI(Packet):
     name = 'Application Protocol Control Information'
     fields_desc = [
@@ -1325,15 +1418,32 @@ class APCI(Packet):
     ]
 
     def do_dissect(self, s):
-        self.START = s[0]
-        self.length = s[1]
-        self.type = s[2] & 0x03 if bool(s[2] & 0x01) else 0x00
-        if self.type == 3:
-            self.UType = (s[2] & 0xfc) >> 2
+        # Fields are written straight into self.fields: a freshly dissected APCI is not
+        # explicit and has no raw cache, which is the state setfieldval would leave behind
+        if len(s) < 6:
+            # Truncated frame: decode byte by byte so it fails with an IndexError as before
+            self.START = s[0]
+            self.length = s[1]
+            self.type = s[2] & 0x03 if bool(s[2] & 0x01) else 0x00
+            if self.type == 3:
+                self.UType = (s[2] & 0xfc) >> 2
+            else:
+                if self.type == 0:
+                    self.Tx = (s[3] << 7) | (s[2] >> 1)
+                self.Rx = (s[5] << 7) | (s[4] >> 1)
+            return s[6:]
+        start, length, control1, control2 = _APCI_HDR.unpack_from(s)
+        self.START = start
+        fields = self.fields
+        fields['length'] = length
+        apci_type, utype = _APCI_CTRL[control1 & 0xff]
+        fields['type'] = apci_type
+        if apci_type == 3:
+            fields['UType'] = utype
         else:
-            if self.type == 0:
-                self.Tx = (s[3] << 7) | (s[2] >> 1)
-            self.Rx = (s[5] << 7) | (s[4] >> 1)
+            if apci_type == 0:
+                fields['Tx'] = control1 >> 1
+            fields['Rx'] = control2 >> 1
         return s[6:]
 
     def dissect(self, s):
@@ -1346,28 +1456,19 @@ class APCI(Packet):
             self.add_payload(APDU(pad))
 
     def do_build(self):
-        s = list(range(6))
-        if self.length is None:
-            self.length = len(self.payload) + 4 if self.payload is not None else 4
-        s[0] = 0x68
-        s[1] = self.length
+        # Build the ASDU once and measure the result, len(self.payload) would serialise it a second time
+        asdu : Optional[bytes] = self.payload.build() if self.haslayer('ASDU') else None
+        length : Optional[int] = self.length
+        if length is None:
+            length = (len(asdu) if asdu is not None else len(self.payload)) + 4
         if self.type == 0x03:
-            s[2] = ((self.UType << 2) & 0xfc) | self.type 
-            s[3] = 0
-            s[4] = 0
-            s[5] = 0
+            s = _APCI_HDR.pack(0x68, length, ((self.UType << 2) & 0xfc) | self.type, 0)
+        elif self.type == 0x00:
+            s = _APCI_HDR.pack(0x68, length, (self.Tx << 1) & 0xfffe, (self.Rx << 1) & 0xfffe)
         else:
-            if self.type == 0x00:
-                s[2] = ((self.Tx << 1) & 0x00fe) | self.type
-                s[3] = ((self.Tx << 1) & 0xff00) >> 8
-            else:
-                s[2] = self.type
-                s[3] = 0
-            s[4] = (self.Rx << 1) & 0x00fe
-            s[5] = ((self.Rx << 1) & 0xff00) >> 8
-        s = bytes(s)
-        if self.haslayer('ASDU'):
-            s += self.payload.build()
+            s = _APCI_HDR.pack(0x68, length, self.type, (self.Rx << 1) & 0xfffe)
+        if asdu is not None:
+            s += asdu
         return s
 
     def extract_padding(self, s):
@@ -1385,6 +1486,20 @@ class APDU(Packet):
 
     def __init__(self, _pkt: bytes = b"", post_transform: Any = None, _internal: int = 0, _underlayer: Optional[Packet] = None, **fields: Any) -> None:
         super().__init__(_pkt, post_transform, _internal, _underlayer, **fields)
+
+    @classmethod
+    def from_layers(cls, apci: APCI, asdu: Optional[ASDU] = None) -> 'APDU':
+        '''Stack freshly built layers in place, without the copies made by the / operator'''
+        if asdu is not None:
+            apci.add_payload(asdu)
+        apdu = cls()
+        apdu.add_payload(apci)
+        return apdu
+
+    def do_build(self) -> bytes:
+        # An APDU has no fields of its own: build the APCI straight away instead of letting
+        # Scapy clone the whole layer stack first
+        return self.do_build_payload()
     
     def dissect(self, s : bytes):
         s = self.pre_dissect(s)
@@ -1401,4 +1516,8 @@ class APDU(Packet):
     def do_dissect(self, s):
         apci = APCI(s, _internal=1, _underlayer=self)
         self.add_payload(apci)
-        return s[len(apci.build()):]
+        if conf.padding:
+            # Any trailing frame was already dissected as a payload of the APCI
+            return b''
+        # The length octet covers everything after itself, no need to rebuild the frame to measure it
+        return s[apci.length + 2 if apci.type == 0x00 and apci.length > 4 else 6:]
@@ -404,6 +404,12 @@ class ModbusListener(ProtocolListener):
                 hnd.join(1)
         listening_sock.close()
 
+# Expected response PDUs for the ModbusClient read requests
+_READ_REGISTER_RESP_TYPES = (smb.ModbusPDU03ReadHoldingRegistersResponse, smb.ModbusPDU04ReadInputRegistersResponse)
+_READ_REGISTER_ERR_TYPES = (smb.ModbusPDU03ReadHoldingRegistersError, smb.ModbusPDU04ReadInputRegistersError)
+_READ_BIT_RESP_TYPES = (smb.ModbusPDU01ReadCoilsResponse, smb.ModbusPDU02ReadDiscreteInputsResponse)
+_READ_BIT_ERR_TYPES = (smb.ModbusPDU01ReadCoilsError, smb.ModbusPDU02ReadDiscreteInputsError)
+
 class ModbusClient:
     """
     Modbus TCP Client
@@ -416,6 +422,19 @@ class ModbusClient:
     class supports the Modbus function codes 0x05 and 0x06 for writing
     values in the device.
     """
+
+    _READ_FLOAT_PDUS = {
+        ModbusMemmap.IR: smb.ModbusPDU03ReadHoldingRegistersRequest,
+        ModbusMemmap.HR: smb.ModbusPDU04ReadInputRegistersRequest
+    }
+    _READ_WORD_PDUS = {
+        ModbusMemmap.HR: smb.ModbusPDU03ReadHoldingRegistersRequest,
+        ModbusMemmap.IR: smb.ModbusPDU04ReadInputRegistersRequest
+    }
+    _READ_BOOL_PDUS = {
+        ModbusMemmap.CO: smb.ModbusPDU01ReadCoilsRequest,
+        ModbusMemmap.DI: smb.ModbusPDU02ReadDiscreteInputsRequest
+    }
     
     def __init__(self, ipaddr : str):
         """
@@ -521,17 +540,13 @@ class ModbusClient:
         assert mapping in [ModbusMemmap.IR, ModbusMemmap.HR], f'Invalid memory mapping ({mapping.value})'
         assert transaction >= 0 and transaction <= 255, f'Transaction ID out of range ({transaction})'
         assert unit >= 0 and unit <= 255, f'Unid ID out of range ({unit})'
-        pdus = {
-            ModbusMemmap.IR: smb.ModbusPDU03ReadHoldingRegistersRequest,
-            ModbusMemmap.HR: smb.ModbusPDU04ReadInputRegistersRequest
-        }
         request : smb.ModbusADURequest = smb.ModbusADURequest(transId=transaction, unitId=unit)
-        request /= pdus[mapping](startAddr=address, quantity=1)
+        request /= self._READ_FLOAT_PDUS[mapping](startAddr=address, quantity=1)
         self._sock.send(request.build())
         buffer : bytes = self._sock.recv(MODBUS_MAX_LENGTH)
         response : smb.ModbusADUResponse = smb.ModbusADUResponse(buffer)
         pdu = response.payload
-        assert isinstance(pdu, (smb.ModbusPDU03ReadHoldingRegistersResponse, smb.ModbusPDU04ReadInputRegistersResponse)), f'Modbus exception: 0x{pdu.exceptCode:02x}' if isinstance(pdu, (smb.ModbusPDU03ReadHoldingRegistersError, smb.ModbusPDU04ReadInputRegistersError)) else f'Received unknown payload: {bytes(pdu)}'
+        assert isinstance(pdu, _READ_REGISTER_RESP_TYPES), f'Modbus exception: 0x{pdu.exceptCode:02x}' if isinstance(pdu, _READ_REGISTER_ERR_TYPES) else f'Received unknown payload: {bytes(pdu)}'
         raw : int = pdu.registerVal[0]
         return struct.unpack('<e', struct.pack('<H', raw))[0]
     
@@ -586,17 +601,13 @@ class ModbusClient:
         assert mapping in [ModbusMemmap.IR, ModbusMemmap.HR], f'Invalid memory mapping ({mapping.value})'
         assert transaction >= 0 and transaction <= 255, f'Transaction ID out of range ({transaction})'
         assert unit >= 0 and unit <= 255, f'Unid ID out of range ({unit})'
-        pdus = {
-            ModbusMemmap.HR: smb.ModbusPDU03ReadHoldingRegistersRequest,
-            ModbusMemmap.IR: smb.ModbusPDU04ReadInputRegistersRequest
-        }
         request : smb.ModbusADURequest = smb.ModbusADURequest(transId=transaction, unitId=unit)
-        request /= pdus[mapping](startAddr=address, quantity=1)
+        request /= self._READ_WORD_PDUS[mapping](startAddr=address, quantity=1)
         self._sock.send(request.build())
         buffer : bytes = self._sock.recv(MODBUS_MAX_LENGTH)
         response : smb.ModbusADUResponse = smb.ModbusADUResponse(buffer)
         pdu = response.payload
-        assert isinstance(pdu, (smb.ModbusPDU03ReadHoldingRegistersResponse, smb.ModbusPDU04ReadInputRegistersResponse)), f'Modbus exception: 0x{pdu.exceptCode:02x}' if isinstance(pdu, (smb.ModbusPDU03ReadHoldingRegistersError, smb.ModbusPDU04ReadInputRegistersError)) else f'Received unknown payload: {bytes(pdu)}'
+        assert isinstance(pdu, _READ_REGISTER_RESP_TYPES), f'Modbus exception: 0x{pdu.exceptCode:02x}' if isinstance(pdu, _READ_REGISTER_ERR_TYPES) else f'Received unknown payload: {bytes(pdu)}'
         value : int = pdu.registerVal[0]
         return value
 
@@ -650,20 +661,144 @@ class ModbusClient:
         assert mapping in [ModbusMemmap.CO, ModbusMemmap.DI], f'Invalid memory mapping ({mapping.value})'
         assert transaction >= 0 and transaction <= 255, f'Transaction ID out of range ({transaction})'
         assert unit >= 0 and unit <= 255, f'Unid ID out of range ({unit})'
-        pdus = {
-            ModbusMemmap.CO: smb.ModbusPDU01ReadCoilsRequest,
-            ModbusMemmap.DI: smb.ModbusPDU02ReadDiscreteInputsRequest
-        }
         request : smb.ModbusADURequest = smb.ModbusADURequest(transId=transaction, unitId=unit)
-        request /= pdus[mapping](startAddr=address, quantity=1)
+        request /= self._READ_BOOL_PDUS[mapping](startAddr=address, quantity=1)
         self._sock.send(request.build())
         buffer : bytes = self._sock.recv(MODBUS_MAX_LENGTH)
         response : smb.ModbusADUResponse = smb.ModbusADUResponse(buffer)
         pdu = response.payload
-        assert isinstance(pdu, (smb.ModbusPDU01ReadCoilsResponse, smb.ModbusPDU02ReadDiscreteInputsResponse)), f'Modbus exception: 0x{pdu.exceptCode:02x}' if isinstance(pdu, (smb.ModbusPDU01ReadCoilsError, smb.ModbusPDU02ReadDiscreteInputsError)) else f'Received unknown payload: {bytes(pdu)}'
+        assert isinstance(pdu, _READ_BIT_RESP_TYPES), f'Modbus exception: 0x{pdu.exceptCode:02x}' if isinstance(pdu, _READ_BIT_ERR_TYPES) else f'Received unknown payload: {bytes(pdu)}'
         value : int = pdu.coilStatus[0] if isinstance(pdu, smb.ModbusPDU01ReadCoilsResponse) else pdu.inputStatus[0]
         return value != 0
 
+    def begin_read_word(self, mapping : ModbusMemmap, address : int, transaction : int = 0x01, unit : int = 0x01) -> int:
+        """
+        Send a request to read a 16-bit integer value from the Modbus device registers, without waiting for the response.
+
+        The response must be collected with `finish_read_word`, which allows the caller to overlap the
+        round trip with other work. Responses are read in the same order the requests were sent.
+
+        :param mapping: The Modbus memory mapping type to read from (ModbusMemmap.IR for holding registers or ModbusMemmap.HR for input registers).
+        :type mapping: ModbusMemmap
+        :param address: The address of the register in the device. Must be in the range [0, 65534].
+        :type address: int
+        :param transaction: The Modbus transaction ID to use in the request. Must be in the range [0, 255]. (default: 0x01)
+        :type transaction: int
+        :param unit: The Modbus unit ID to use in the request. Must be in the range [0, 255]. (default: 0x01)
+        :type unit: int
+        :return: The transaction ID of the pending request.
+        :rtype: int
+        :raises AssertionError: If a parameter value is out of range.
+        :raises BrokenPipe: If the socket disconnects from the device.
+        """
+        assert address >= 0 and address <= 65534, f'Address out of range ({address})'
+        assert mapping in [ModbusMemmap.IR, ModbusMemmap.HR], f'Invalid memory mapping ({mapping.value})'
+        assert transaction >= 0 and transaction <= 255, f'Transaction ID out of range ({transaction})'
+        assert unit >= 0 and unit <= 255, f'Unid ID out of range ({unit})'
+        request : smb.ModbusADURequest = smb.ModbusADURequest(transId=transaction, unitId=unit)
+        request /= self._READ_WORD_PDUS[mapping](startAddr=address, quantity=1)
+        self._sock.sendall(request.build())
+        return transaction
+
+    def finish_read_word(self, transaction : int) -> int:
+        """
+        Receive the response to a request sent with `begin_read_word`.
+
+        :param transaction: The transaction ID returned by `begin_read_word`.
+        :type transaction: int
+        :return: The 16-bit integer value read from the device.
+        :rtype: int
+        :raises AssertionError: If the response does not match the transaction or if a Modbus exception is received as a result of the transaction.
+        :raises socket.timeout: If a socket timeout occurs during the operation.
+        :raises BrokenPipe: If the socket disconnects from the device.
+        """
+        header : bytes = self._recv_exact(6)
+        trans_id, _, length = struct.unpack('>HHH', header)
+        response : smb.ModbusADUResponse = smb.ModbusADUResponse(header + self._recv_exact(length))
+        pdu = response.payload
+        assert trans_id == transaction, f'Unexpected transaction ID ({trans_id})'
+        assert isinstance(pdu, _READ_REGISTER_RESP_TYPES), f'Modbus exception: 0x{pdu.exceptCode:02x}' if isinstance(pdu, _READ_REGISTER_ERR_TYPES) else f'Received unknown payload: {bytes(pdu)}'
+        return pdu.registerVal[0]
+
+    def _recv_exact(self, length : int) -> bytes:
+        """
+        Receive exactly `length` bytes from the device.
+
+        :param length: The number of bytes to receive.
+        :type length: int
+        :return: The received bytes.
+        :rtype: bytes
+        :raises BrokenPipe: If the socket disconnects from the device.
+        :raises socket.timeout: If a socket timeout occurs during the operation.
+        """
+        buffer : bytearray = bytearray()
+        while len(buffer) < length:
+            chunk : bytes = self._sock.recv(length - len(buffer))
+            if not chunk:
+                raise BrokenPipeError(f'Connection closed by {self._ipaddr}')
+            buffer += chunk
+        return bytes(buffer)
+
+    def read_many_pipelined(self, mapping : ModbusMemmap, addresses : list[int], unit : int = 0x01) -> list:
+        """
+        Read several values from the Modbus device, sending all the requests before waiting for the responses.
+
+        Each request uses its position within `addresses` as the Modbus transaction ID, which is used
+        to match the responses regardless of the order in which the device answers them.
+
+        :param mapping: The Modbus memory mapping type to read from (ModbusMemmap.HR/ModbusMemmap.IR for 16-bit integer values or ModbusMemmap.CO/ModbusMemmap.DI for boolean values).
+        :type mapping: ModbusMemmap
+        :param addresses: The addresses to read from. Each address must be in the range [0, 65534].
+        :type addresses: list[int]
+        :param unit: The Modbus unit ID to use in the requests. Must be in the range [0, 255]. (default: 0x01)
+        :type unit: int
+        :return: The values read from the device, in the same order as `addresses`.
+        :rtype: list
+        :raises AssertionError: If a parameter value is out of range, if a Modbus exception is received as a result of any transaction, or if a response carries an unknown or repeated transaction ID. All the responses are read before raising.
+        :raises socket.timeout: If a socket timeout occurs during the operation.
+        :raises BrokenPipe: If the socket disconnects from the device.
+        """
+        assert len(addresses) <= 65536, f'Too many pipelined requests ({len(addresses)})'
+        assert all(address >= 0 and address <= 65534 for address in addresses), f'Address out of range ({[a for a in addresses if a < 0 or a > 65534]})'
+        assert unit >= 0 and unit <= 255, f'Unid ID out of range ({unit})'
+        if mapping in self._READ_WORD_PDUS:
+            pdus = self._READ_WORD_PDUS
+            resp_types, err_types = _READ_REGISTER_RESP_TYPES, _READ_REGISTER_ERR_TYPES
+        else:
+            assert mapping in self._READ_BOOL_PDUS, f'Invalid memory mapping ({mapping.value})'
+            pdus = self._READ_BOOL_PDUS
+            resp_types, err_types = _READ_BIT_RESP_TYPES, _READ_BIT_ERR_TYPES
+        requests : bytes = b''.join(
+            (smb.ModbusADURequest(transId=i, unitId=unit)/pdus[mapping](startAddr=address, quantity=1)).build()
+            for i, address in enumerate(addresses)
+        )
+        self._sock.sendall(requests)
+        results : list = [None] * len(addresses)
+        seen : set[int] = set()
+        errors : list[str] = []
+        # Every response is read before reporting a failed transaction, otherwise the replies
+        # still pending would be taken as the answer to the next request on this client
+        for _ in range(len(addresses)):
+            header : bytes = self._recv_exact(6)
+            trans_id, _, length = struct.unpack('>HHH', header)
+            response : smb.ModbusADUResponse = smb.ModbusADUResponse(header + self._recv_exact(length))
+            pdu = response.payload
+            if trans_id >= len(addresses) or trans_id in seen:
+                errors.append(f'Unexpected transaction ID ({trans_id})')
+                continue
+            seen.add(trans_id)
+            if not isinstance(pdu, resp_types):
+                errors.append(f'Modbus exception: 0x{pdu.exceptCode:02x}' if isinstance(pdu, err_types) else f'Received unknown payload: {bytes(pdu)}')
+            elif isinstance(pdu, _READ_REGISTER_RESP_TYPES):
+                results[trans_id] = pdu.registerVal[0]
+            elif isinstance(pdu, smb.ModbusPDU01ReadCoilsResponse):
+                results[trans_id] = pdu.coilStatus[0] != 0
+            else:
+                results[trans_id] = pdu.inputStatus[0] != 0
+        assert not errors, '\r\n'.join(errors)
+        assert len(seen) == len(addresses), f'Missing responses for transactions: {[i for i in range(len(addresses)) if i not in seen]}'
+        return results
+
     def read_coil(self, address : int, transaction : int = 0x01, unit : int = 0x01) -> bool:
         return self.read_bool(ModbusMemmap.CO, address, transaction, unit)
     
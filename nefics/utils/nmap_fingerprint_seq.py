@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 '''Scan a target multiple times to determine the SP and ISR values.'''
 
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
 from nmap3 import Nmap
 from re import compile
 from tqdm import tqdm
@@ -11,10 +13,13 @@ SP_RE = compile(r'^SEQ\([^(]*?SP=([0-9A-Fa-f]+?)%[^)]*?\)$')
 ISR_RE = compile(r'^SEQ\([^(]*?ISR=([0-9A-Fa-f]+?)%[^)]*?\)$')
 SCAN_RE = compile(r'^SCAN\([^)]+?\)(.*)$')
 
+def run_scan(command : str) -> str:
+    return Nmap().run_command(command)
+
 def main(ipaddr : str, count : int):
     nmap = Nmap()
-    spvals : list[int] = []
-    isrvals : list[int] = []
+    sp_raw : set[str] = set()
+    isr_raw : set[str] = set()
     scanerr : list[int] = []
     command = f'nmap -oX - -vvvv -p T:1-65535,U:53,67,68,161 --max-retries 3 --max-scan-delay 5ms --min-parallelism 10 -sSU -O -n -T4 -Pn {ipaddr}'
     '''
@@ -31,8 +36,11 @@ def main(ipaddr : str, count : int):
     - (-Pn) Don't ping
     '''
     fingerprint : str = None
-    for i in tqdm(range(count), unit='scan'):
-        rawxml = nmap.run_command(command)
+    rawxmls : list[str] = []
+    if count > 0: # A pool needs at least one worker; no scans just reports empty results
+        with ProcessPoolExecutor(max_workers=min(count, (cpu_count() or 1) * 2)) as executor:
+            rawxmls = list(tqdm(executor.map(run_scan, [command] * count), total=count, unit='scan', mininterval=1.0, smoothing=0.1))
+    for i, rawxml in enumerate(rawxmls):
         xmlroot = nmap.get_xml_et(rawxml)
         host = xmlroot.find('host')
         if host is not None:
@@ -45,22 +53,13 @@ def main(ipaddr : str, count : int):
                         fp = SCAN_RE.match(fingerp).groups()[0]
                         fingerprint = fp.replace(')',')\n')[:-1]
                     for seq in SEQ_RE.findall(fingerp):
-                        sp = SP_RE.findall(seq)
-                        isr = ISR_RE.findall(seq)
-                        if len(sp):
-                            for s in sp:
-                                s = int(s, 16)
-                                if s not in spvals:
-                                    spvals.append(s)
-                        if len(isr):
-                            for ir in isr:
-                                ir = int(ir, 16)
-                                if ir not in isrvals:
-                                    isrvals.append(ir)
+                        sp_raw.update(SP_RE.findall(seq))
+                        isr_raw.update(ISR_RE.findall(seq))
                 else:
                     scanerr.append(i)
-    spvals.sort()
-    isrvals.sort()
+    # Convert each distinct hex string only once
+    spvals : list[int] = sorted({int(s, 16) for s in sp_raw})
+    isrvals : list[int] = sorted({int(ir, 16) for ir in isr_raw})
     print(
         f'{fingerprint}\n\n'
         f'Scan error runs: {scanerr}\n'
@@ -2,6 +2,8 @@
 '''Scan a device to determine its OS.'''
 
 import nmap3
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import argparse
 from tqdm import tqdm
 
@@ -15,6 +17,8 @@ NMAP_ARGS : str = '-Pn -n -sS -sV -O -p 1-10240'
 - (-p 1-10240) Scan ports
 '''
 
+MAX_WORKERS : int = 4 # nmap already sends many probes in parallel, keep the number of concurrent scans low
+
 def main():
     aparser = argparse.ArgumentParser()
     aparser.add_argument('ip')
@@ -24,20 +28,15 @@ def main():
     scans = int(args.num_scans)
     nm = nmap3.Nmap()
     results = []
-    for i in tqdm(range(scans), unit='scans'):
-        r = nm.scan_command(ip_addr, NMAP_ARGS)
-        r = nm.parser.os_identifier_parser(r)
-        for rr in r[ip_addr]['osmatch']:
-            results.append((rr['name'], rr['accuracy']))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(nm.scan_command, ip_addr, NMAP_ARGS) for _ in range(scans)]
+        for f in tqdm(as_completed(futures), total=scans, unit='scans', mininterval=1.0, smoothing=0.1):
+            r = nm.parser.os_identifier_parser(f.result())
+            for rr in r[ip_addr]['osmatch']:
+                results.append((rr['name'], rr['accuracy']))
     print('\r\n')
-    sorted_results = {}
-    for r in results:
-        if r in sorted_results.keys():
-            sorted_results[r] += 1
-        else:
-            sorted_results[r] = 1
-    for rr in [(r[0], r[1], sorted_results[r]) for r in sorted_results.keys()]:
-        print(f'"{rr[0]}",{rr[1]},{rr[2]}')
+    for (name, accuracy), hits in Counter(results).most_common():
+        print(f'"{name}",{accuracy},{hits}')
 
 if __name__ == '__main__':
     main()
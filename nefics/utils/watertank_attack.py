@@ -1,17 +1,19 @@
 #!/usr/bin/env python3
 
 from argparse import ArgumentParser
-from socket import inet_aton
-from time import sleep
-from datetime import datetime
+from ipaddress import IPv4Address
+from time import monotonic, sleep, time
 
-from nefics.protos.modbus import ModbusClient
+from nefics.protos.modbus import ModbusClient, ModbusMemmap
+
+POLL_INTERVAL : float = 0.01
+LOG_BATCH     : int = 64
 
 def valid_ipv4(ip_addr : str) -> bool:
     try:
-        inet_aton(ip_addr)
+        IPv4Address(ip_addr)
         return True
-    except OSError:
+    except ValueError:
         return False
 
 def main():
@@ -30,14 +32,31 @@ def main():
         target.connect()
         value = (target.read_input_word(ir_addr) * 3.0) / 1000.0
         target.send_word(hr_addr, 0) # New set point = 0
-        with open(f'watertank_log_{int(datetime.now().timestamp())}.csv','wt') as log:
-            while value > 0.33:
-                log.write(f'{datetime.now().timestamp()},{value}\r\n')
-                print(f'Current value: {value}', end='\r')
-                value = (target.read_input_word(ir_addr) * 3.0) / 1000.0
-                sleep(0.01)
+        with open(f'watertank_log_{int(time())}.csv', 'wb', buffering=1 << 16) as log:
+            buf = bytearray()
+            rows = 0
+            deadline = monotonic()
+            # Keep one read outstanding, so the round trip overlaps the wait for the next deadline
+            transaction = target.begin_read_word(ModbusMemmap.IR, ir_addr, 0)
+            try:
+                while value > 0.33:
+                    buf += f'{time()},{value}\r\n'.encode()
+                    rows += 1
+                    if rows == LOG_BATCH:
+                        log.write(buf)
+                        buf.clear()
+                        rows = 0
+                    print(f'Current value: {value}', end='\r')
+                    deadline += POLL_INTERVAL
+                    sleep(max(0.0, deadline - monotonic()))
+                    raw = target.finish_read_word(transaction)
+                    transaction = target.begin_read_word(ModbusMemmap.IR, ir_addr, transaction ^ 1)
+                    value = (raw * 3.0) / 1000.0
+                target.finish_read_word(transaction)
+            finally:
+                # Rows still batched when a read fails or the user interrupts must reach the log too
+                log.write(buf)
             print('\r')
-            log.flush()
         target.close()
     except AssertionError as e:
         print(str(e))
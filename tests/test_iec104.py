@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 
+import pytest
+
 from nefics.protos.iec10x.packets import *
+from scapy.fields import FlagValue
 
 def test_TESTFR_actcon():
     apdu = APDU(b'\x68\x04\x83\x00\x00\x00')
@@ -308,7 +311,7 @@ def test_M_SP_TA_1():
     assert len(asdu.IO) == 1
     assert asdu.IO[0].IOA == 1
     assert asdu.IO[0].SIQ == 0xa1
-    assert asdu.IO[0].getfieldval('time') == CP24Time2a(b'\x39\x30\x25')
+    assert asdu.IO[0].getfieldval('time') == cptime
     assert asdu.IO[0].balanced
     apdu = APDU(b'\x68\x14\x02\x00\x02\x00\x02\x02\x03\x01\x01\x00\xa1\x39\x30\x25\x02\x00\x01\x39\x30\x25')
     assert apdu.haslayer('APCI')
@@ -330,11 +333,11 @@ def test_M_SP_TA_1():
     assert len(asdu.IO) == 2
     assert asdu.IO[0].IOA == 1
     assert asdu.IO[0].SIQ == 0xa1
-    assert asdu.IO[0].getfieldval('time') == CP24Time2a(b'\x39\x30\x25')
+    assert asdu.IO[0].getfieldval('time') == cptime
     assert asdu.IO[0].balanced
     assert asdu.IO[1].IOA == 2
     assert asdu.IO[1].SIQ == 0x01
-    assert asdu.IO[1].getfieldval('time') == CP24Time2a(b'\x39\x30\x25')
+    assert asdu.IO[1].getfieldval('time') == cptime
     assert asdu.IO[1].balanced
     apdu = APDU(b'\x68\x0f\x02\x00\x02\x00\x02\x01\x03\x01\x01\x00\x00\xa1\x39\x30\x25')
     assert apdu.haslayer('APCI')
@@ -356,7 +359,7 @@ def test_M_SP_TA_1():
     assert len(asdu.IO) == 1
     assert asdu.IO[0].IOA == 1
     assert asdu.IO[0].SIQ == 0xa1
-    assert asdu.IO[0].getfieldval('time') == CP24Time2a(b'\x39\x30\x25')
+    assert asdu.IO[0].getfieldval('time') == cptime
     assert not asdu.IO[0].balanced
     apdu = APDU(b'\x68\x16\x02\x00\x02\x00\x02\x02\x03\x01\x01\x00\x00\xa1\x39\x30\x25\x02\x00\x00\x01\x39\x30\x25')
     assert apdu.haslayer('APCI')
@@ -378,11 +381,11 @@ def test_M_SP_TA_1():
     assert len(asdu.IO) == 2
     assert asdu.IO[0].IOA == 1
     assert asdu.IO[0].SIQ == 0xa1
-    assert asdu.IO[0].getfieldval('time') == CP24Time2a(b'\x39\x30\x25')
+    assert asdu.IO[0].getfieldval('time') == cptime
     assert not asdu.IO[0].balanced
     assert asdu.IO[1].IOA == 2
     assert asdu.IO[1].SIQ == 0x01
-    assert asdu.IO[1].getfieldval('time') == CP24Time2a(b'\x39\x30\x25')
+    assert asdu.IO[1].getfieldval('time') == cptime
     assert not asdu.IO[1].balanced
 
 def test_M_DP_NA_1():
@@ -409,93 +412,102 @@ def test_M_DP_NA_1():
     assert apdu.build() == b'\x68\x10\x02\x00\x02\x00\x03\x02\x03\x01\x01\x00\x00\x03\x02\x00\x00\x03'
     apdu = APDU(b'\x68\x0b\x02\x00\x02\x00\x03\x01\x03\x01\x01\x00\x03')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 11
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 11
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x03
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 1
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO3) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 1
-    assert apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 0x01
-    assert apdu['ASDU'].IO[0].DIQ.quality == 0b000000
-    assert apdu['ASDU'].IO[0].DIQ.DPI == 0b11
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x03
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 1
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO3) for x in asdu.IO)
+    assert len(asdu.IO) == 1
+    assert asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 0x01
+    assert asdu.IO[0].DIQ.quality == 0b000000
+    assert asdu.IO[0].DIQ.DPI == 0b11
     apdu = APDU(b'\x68\x0e\x02\x00\x02\x00\x03\x02\x03\x01\x01\x00\x03\x02\x00\x03')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 14
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 14
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x03
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 2
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO3) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 2
-    assert apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 0x01
-    assert apdu['ASDU'].IO[0].DIQ.quality == 0b000000
-    assert apdu['ASDU'].IO[0].DIQ.DPI == 0b11
-    assert apdu['ASDU'].IO[1].balanced
-    assert apdu['ASDU'].IO[1].IOA == 0x02
-    assert apdu['ASDU'].IO[1].DIQ.quality == 0b000000
-    assert apdu['ASDU'].IO[1].DIQ.DPI == 0b11
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x03
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 2
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO3) for x in asdu.IO)
+    assert len(asdu.IO) == 2
+    assert asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 0x01
+    assert asdu.IO[0].DIQ.quality == 0b000000
+    assert asdu.IO[0].DIQ.DPI == 0b11
+    assert asdu.IO[1].balanced
+    assert asdu.IO[1].IOA == 0x02
+    assert asdu.IO[1].DIQ.quality == 0b000000
+    assert asdu.IO[1].DIQ.DPI == 0b11
     apdu = APDU(b'\x68\x0c\x02\x00\x02\x00\x03\x01\x03\x01\x01\x00\x00\x03')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 12
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 12
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x03
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 1
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO3) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 1
-    assert not apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 0x01
-    assert apdu['ASDU'].IO[0].DIQ.quality == 0b000000
-    assert apdu['ASDU'].IO[0].DIQ.DPI == 0b11
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x03
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 1
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO3) for x in asdu.IO)
+    assert len(asdu.IO) == 1
+    assert not asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 0x01
+    assert asdu.IO[0].DIQ.quality == 0b000000
+    assert asdu.IO[0].DIQ.DPI == 0b11
     apdu = APDU(b'\x68\x10\x02\x00\x02\x00\x03\x02\x03\x01\x01\x00\x00\x03\x02\x00\x00\x03')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 16
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 16
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x03
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 2
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO3) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 2
-    assert not apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 0x01
-    assert apdu['ASDU'].IO[0].DIQ.quality == 0b000000
-    assert apdu['ASDU'].IO[0].DIQ.DPI == 0b11
-    assert not apdu['ASDU'].IO[1].balanced
-    assert apdu['ASDU'].IO[1].IOA == 0x02
-    assert apdu['ASDU'].IO[1].DIQ.quality == 0b000000
-    assert apdu['ASDU'].IO[1].DIQ.DPI == 0b11
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x03
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 2
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO3) for x in asdu.IO)
+    assert len(asdu.IO) == 2
+    assert not asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 0x01
+    assert asdu.IO[0].DIQ.quality == 0b000000
+    assert asdu.IO[0].DIQ.DPI == 0b11
+    assert not asdu.IO[1].balanced
+    assert asdu.IO[1].IOA == 0x02
+    assert asdu.IO[1].DIQ.quality == 0b000000
+    assert asdu.IO[1].DIQ.DPI == 0b11
     # Sequence of information elements in a single information object (SQ = 1)
+    apci : APCI = APCI(type=0x00, Tx=1, Rx=1)
     vsq1 : VSQ = VSQ(SQ=1, number=1)
     vsq2 : VSQ = VSQ(SQ=1, number=2)
     io : IO3 = IO3(IOA=1, DIQ=diq, _sq=1, _number=1, _balanced=True)
@@ -516,92 +528,100 @@ def test_M_DP_NA_1():
     assert apdu.build() == b'\x68\x0d\x02\x00\x02\x00\x03\x82\x03\x01\x01\x00\x00\x03\x03'
     apdu = APDU(b'\x68\x0b\x02\x00\x02\x00\x03\x81\x03\x01\x01\x00\x03')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 11
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 11
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x03
-    assert apdu['ASDU'].VSQ.SQ == 1
-    assert apdu['ASDU'].VSQ.number == 1
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, IO3)
-    assert apdu['ASDU'].IO.balanced
-    assert apdu['ASDU'].IO.IOA == 0x01
-    assert isinstance(apdu['ASDU'].IO.DIQ, list)
-    assert all(isinstance(x, DIQ) for x in apdu['ASDU'].IO.DIQ)
-    assert len(apdu['ASDU'].IO.DIQ) == 1
-    assert apdu['ASDU'].IO.DIQ[0].quality == 0b000000
-    assert apdu['ASDU'].IO.DIQ[0].DPI == 0b11
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x03
+    assert asdu.VSQ.SQ == 1
+    assert asdu.VSQ.number == 1
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, IO3)
+    assert asdu.IO.balanced
+    assert asdu.IO.IOA == 0x01
+    assert isinstance(asdu.IO.DIQ, list)
+    assert all(isinstance(x, DIQ) for x in asdu.IO.DIQ)
+    assert len(asdu.IO.DIQ) == 1
+    assert asdu.IO.DIQ[0].quality == 0b000000
+    assert asdu.IO.DIQ[0].DPI == 0b11
     apdu = APDU(b'\x68\x0c\x02\x00\x02\x00\x03\x82\x03\x01\x01\x00\x03\x03')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 12
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 12
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x03
-    assert apdu['ASDU'].VSQ.SQ == 1
-    assert apdu['ASDU'].VSQ.number == 2
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, IO3)
-    assert apdu['ASDU'].IO.balanced
-    assert apdu['ASDU'].IO.IOA == 0x01
-    assert isinstance(apdu['ASDU'].IO.DIQ, list)
-    assert all(isinstance(x, DIQ) for x in apdu['ASDU'].IO.DIQ)
-    assert len(apdu['ASDU'].IO.DIQ) == 2
-    assert apdu['ASDU'].IO.DIQ[0].quality == 0b000000
-    assert apdu['ASDU'].IO.DIQ[0].DPI == 0b11
-    assert apdu['ASDU'].IO.DIQ[1].quality == 0b000000
-    assert apdu['ASDU'].IO.DIQ[1].DPI == 0b11
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x03
+    assert asdu.VSQ.SQ == 1
+    assert asdu.VSQ.number == 2
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, IO3)
+    assert asdu.IO.balanced
+    assert asdu.IO.IOA == 0x01
+    assert isinstance(asdu.IO.DIQ, list)
+    assert all(isinstance(x, DIQ) for x in asdu.IO.DIQ)
+    assert len(asdu.IO.DIQ) == 2
+    assert asdu.IO.DIQ[0].quality == 0b000000
+    assert asdu.IO.DIQ[0].DPI == 0b11
+    assert asdu.IO.DIQ[1].quality == 0b000000
+    assert asdu.IO.DIQ[1].DPI == 0b11
     apdu = APDU(b'\x68\x0c\x02\x00\x02\x00\x03\x81\x03\x01\x01\x00\x00\x03')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 12
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 12
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x03
-    assert apdu['ASDU'].VSQ.SQ == 1
-    assert apdu['ASDU'].VSQ.number == 1
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, IO3)
-    assert not apdu['ASDU'].IO.balanced
-    assert apdu['ASDU'].IO.IOA == 0x01
-    assert isinstance(apdu['ASDU'].IO.DIQ, list)
-    assert all(isinstance(x, DIQ) for x in apdu['ASDU'].IO.DIQ)
-    assert len(apdu['ASDU'].IO.DIQ) == 1
-    assert apdu['ASDU'].IO.DIQ[0].quality == 0b000000
-    assert apdu['ASDU'].IO.DIQ[0].DPI == 0b11
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x03
+    assert asdu.VSQ.SQ == 1
+    assert asdu.VSQ.number == 1
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, IO3)
+    assert not asdu.IO.balanced
+    assert asdu.IO.IOA == 0x01
+    assert isinstance(asdu.IO.DIQ, list)
+    assert all(isinstance(x, DIQ) for x in asdu.IO.DIQ)
+    assert len(asdu.IO.DIQ) == 1
+    assert asdu.IO.DIQ[0].quality == 0b000000
+    assert asdu.IO.DIQ[0].DPI == 0b11
     apdu = APDU(b'\x68\x0d\x02\x00\x02\x00\x03\x82\x03\x01\x01\x00\x00\x03\x03')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 13
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 13
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x03
-    assert apdu['ASDU'].VSQ.SQ == 1
-    assert apdu['ASDU'].VSQ.number == 2
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, IO3)
-    assert not apdu['ASDU'].IO.balanced
-    assert apdu['ASDU'].IO.IOA == 0x01
-    assert isinstance(apdu['ASDU'].IO.DIQ, list)
-    assert all(isinstance(x, DIQ) for x in apdu['ASDU'].IO.DIQ)
-    assert len(apdu['ASDU'].IO.DIQ) == 2
-    assert apdu['ASDU'].IO.DIQ[0].quality == 0b000000
-    assert apdu['ASDU'].IO.DIQ[0].DPI == 0b11
-    assert apdu['ASDU'].IO.DIQ[1].quality == 0b000000
-    assert apdu['ASDU'].IO.DIQ[1].DPI == 0b11
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x03
+    assert asdu.VSQ.SQ == 1
+    assert asdu.VSQ.number == 2
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, IO3)
+    assert not asdu.IO.balanced
+    assert asdu.IO.IOA == 0x01
+    assert isinstance(asdu.IO.DIQ, list)
+    assert all(isinstance(x, DIQ) for x in asdu.IO.DIQ)
+    assert len(asdu.IO.DIQ) == 2
+    assert asdu.IO.DIQ[0].quality == 0b000000
+    assert asdu.IO.DIQ[0].DPI == 0b11
+    assert asdu.IO.DIQ[1].quality == 0b000000
+    assert asdu.IO.DIQ[1].DPI == 0b11
 
 def test_M_DP_TA_1():
     apci : APCI = APCI(type=0x00, Tx=1, Rx=1)
@@ -627,98 +647,106 @@ def test_M_DP_TA_1():
     assert apdu.build() == b'\x68\x16\x02\x00\x02\x00\x04\x02\x03\x01\x01\x00\x00\x03\x39\x30\x25\x02\x00\x00\x03\x39\x30\x25'
     apdu = APDU(b'\x68\x0e\x02\x00\x02\x00\x04\x01\x03\x01\x01\x00\x03\x39\x30\x25')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 14
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 14
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x04
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 1
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO4) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 1
-    assert apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 1
-    assert apdu['ASDU'].IO[0].DIQ.quality == 0b000000
-    assert apdu['ASDU'].IO[0].DIQ.DPI == 0b11
-    assert apdu['ASDU'].IO[0].getfieldval('time') == cptime
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x04
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 1
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO4) for x in asdu.IO)
+    assert len(asdu.IO) == 1
+    assert asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 1
+    assert asdu.IO[0].DIQ.quality == 0b000000
+    assert asdu.IO[0].DIQ.DPI == 0b11
+    assert asdu.IO[0].getfieldval('time') == cptime
     apdu = APDU(b'\x68\x14\x02\x00\x02\x00\x04\x02\x03\x01\x01\x00\x03\x39\x30\x25\x02\x00\x03\x39\x30\x25')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 20
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 20
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x04
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 2
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO4) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 2
-    assert apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 1
-    assert apdu['ASDU'].IO[0].DIQ.quality == 0b000000
-    assert apdu['ASDU'].IO[0].DIQ.DPI == 0b11
-    assert apdu['ASDU'].IO[0].getfieldval('time') == cptime
-    assert apdu['ASDU'].IO[1].balanced
-    assert apdu['ASDU'].IO[1].IOA == 2
-    assert apdu['ASDU'].IO[1].DIQ.quality == 0b000000
-    assert apdu['ASDU'].IO[1].DIQ.DPI == 0b11
-    assert apdu['ASDU'].IO[1].getfieldval('time') == cptime
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x04
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 2
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO4) for x in asdu.IO)
+    assert len(asdu.IO) == 2
+    assert asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 1
+    assert asdu.IO[0].DIQ.quality == 0b000000
+    assert asdu.IO[0].DIQ.DPI == 0b11
+    assert asdu.IO[0].getfieldval('time') == cptime
+    assert asdu.IO[1].balanced
+    assert asdu.IO[1].IOA == 2
+    assert asdu.IO[1].DIQ.quality == 0b000000
+    assert asdu.IO[1].DIQ.DPI == 0b11
+    assert asdu.IO[1].getfieldval('time') == cptime
     apdu = APDU(b'\x68\x0f\x02\x00\x02\x00\x04\x01\x03\x01\x01\x00\x00\x03\x39\x30\x25')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 15
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 15
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x04
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 1
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO4) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 1
-    assert not apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 1
-    assert apdu['ASDU'].IO[0].DIQ.quality == 0b000000
-    assert apdu['ASDU'].IO[0].DIQ.DPI == 0b11
-    assert apdu['ASDU'].IO[0].getfieldval('time') == cptime
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x04
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 1
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO4) for x in asdu.IO)
+    assert len(asdu.IO) == 1
+    assert not asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 1
+    assert asdu.IO[0].DIQ.quality == 0b000000
+    assert asdu.IO[0].DIQ.DPI == 0b11
+    assert asdu.IO[0].getfieldval('time') == cptime
     apdu = APDU(b'\x68\x16\x02\x00\x02\x00\x04\x02\x03\x01\x01\x00\x00\x03\x39\x30\x25\x02\x00\x00\x03\x39\x30\x25')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 22
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 22
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x04
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 2
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO4) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 2
-    assert not apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 1
-    assert apdu['ASDU'].IO[0].DIQ.quality == 0b000000
-    assert apdu['ASDU'].IO[0].DIQ.DPI == 0b11
-    assert apdu['ASDU'].IO[0].getfieldval('time') == cptime
-    assert not apdu['ASDU'].IO[1].balanced
-    assert apdu['ASDU'].IO[1].IOA == 2
-    assert apdu['ASDU'].IO[1].DIQ.quality == 0b000000
-    assert apdu['ASDU'].IO[1].DIQ.DPI == 0b11
-    assert apdu['ASDU'].IO[1].getfieldval('time') == cptime
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x04
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 2
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO4) for x in asdu.IO)
+    assert len(asdu.IO) == 2
+    assert not asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 1
+    assert asdu.IO[0].DIQ.quality == 0b000000
+    assert asdu.IO[0].DIQ.DPI == 0b11
+    assert asdu.IO[0].getfieldval('time') == cptime
+    assert not asdu.IO[1].balanced
+    assert asdu.IO[1].IOA == 2
+    assert asdu.IO[1].DIQ.quality == 0b000000
+    assert asdu.IO[1].DIQ.DPI == 0b11
+    assert asdu.IO[1].getfieldval('time') == cptime
 
 def test_M_ST_NA_1():
     apci : APCI = APCI(type=0x00, Tx=1, Rx=1)
@@ -744,87 +772,96 @@ def test_M_ST_NA_1():
     assert apdu.build() == b'\x68\x12\x02\x00\x02\x00\x05\x02\x03\x01\x01\x00\x00\x01\x00\x02\x00\x00\x01\x00'
     apdu = APDU(b'\x68\x0c\x02\x00\x02\x00\x05\x01\x03\x01\x01\x00\x01\x00')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 12
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 12
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x05
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 1
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO5) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 1
-    assert apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 1
-    assert apdu['ASDU'].IO[0].information == spos
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x05
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 1
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO5) for x in asdu.IO)
+    assert len(asdu.IO) == 1
+    assert asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 1
+    assert asdu.IO[0].information == spos
     apdu = APDU(b'\x68\x10\x02\x00\x02\x00\x05\x02\x03\x01\x01\x00\x01\x00\x02\x00\x01\x00')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 16
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 16
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x05
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 2
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO5) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 2
-    assert apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 1
-    assert apdu['ASDU'].IO[0].information == spos
-    assert apdu['ASDU'].IO[1].balanced
-    assert apdu['ASDU'].IO[1].IOA == 2
-    assert apdu['ASDU'].IO[1].information == spos
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x05
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 2
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO5) for x in asdu.IO)
+    assert len(asdu.IO) == 2
+    assert asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 1
+    assert asdu.IO[0].information == spos
+    assert asdu.IO[1].balanced
+    assert asdu.IO[1].IOA == 2
+    assert asdu.IO[1].information == spos
     apdu = APDU(b'\x68\x0d\x02\x00\x02\x00\x05\x01\x03\x01\x01\x00\x00\x01\x00')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 13
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 13
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x05
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 1
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO5) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 1
-    assert not apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 1
-    assert apdu['ASDU'].IO[0].information == spos
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x05
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 1
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO5) for x in asdu.IO)
+    assert len(asdu.IO) == 1
+    assert not asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 1
+    assert asdu.IO[0].information == spos
     apdu = APDU(b'\x68\x12\x02\x00\x02\x00\x05\x02\x03\x01\x01\x00\x00\x01\x00\x02\x00\x00\x01\x00')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 18
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 18
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x05
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 2
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO5) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 2
-    assert not apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 1
-    assert apdu['ASDU'].IO[0].information == spos
-    assert not apdu['ASDU'].IO[1].balanced
-    assert apdu['ASDU'].IO[1].IOA == 2
-    assert apdu['ASDU'].IO[1].information == spos
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x05
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 2
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO5) for x in asdu.IO)
+    assert len(asdu.IO) == 2
+    assert not asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 1
+    assert asdu.IO[0].information == spos
+    assert not asdu.IO[1].balanced
+    assert asdu.IO[1].IOA == 2
+    assert asdu.IO[1].information == spos
     # Sequence of information elements in a single information object (SQ = 1)
+    apci : APCI = APCI(type=0x00, Tx=1, Rx=1)
     vsq1 : VSQ = VSQ(SQ=1, number=1)
     vsq2 : VSQ = VSQ(SQ=1, number=2)
     io : IO5 = IO5(IOA=0x01, information=[spos], _sq=1, _number=1, _balanced=True)
@@ -845,84 +882,92 @@ def test_M_ST_NA_1():
     assert apdu.build() == b'\x68\x0f\x02\x00\x02\x00\x05\x82\x03\x01\x01\x00\x00\x01\x00\x01\x00'
     apdu = APDU(b'\x68\x0c\x02\x00\x02\x00\x05\x81\x03\x01\x01\x00\x01\x00')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 12
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 12
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x05
-    assert apdu['ASDU'].VSQ.SQ == 1
-    assert apdu['ASDU'].VSQ.number == 1
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, IO5)
-    assert apdu['ASDU'].IO.balanced
-    assert apdu['ASDU'].IO.IOA == 0x01
-    assert isinstance(apdu['ASDU'].IO.information, list)
-    assert all(isinstance(x, StepPosition) for x in apdu['ASDU'].IO.information)
-    assert all(x == spos for x in apdu['ASDU'].IO.information)
-    assert len(apdu['ASDU'].IO.information) == 1
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x05
+    assert asdu.VSQ.SQ == 1
+    assert asdu.VSQ.number == 1
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, IO5)
+    assert asdu.IO.balanced
+    assert asdu.IO.IOA == 0x01
+    assert isinstance(asdu.IO.information, list)
+    assert all(isinstance(x, StepPosition) for x in asdu.IO.information)
+    assert all(x == spos for x in asdu.IO.information)
+    assert len(asdu.IO.information) == 1
     apdu = APDU(b'\x68\x0e\x02\x00\x02\x00\x05\x82\x03\x01\x01\x00\x01\x00\x01\x00')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 14
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 14
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x05
-    assert apdu['ASDU'].VSQ.SQ == 1
-    assert apdu['ASDU'].VSQ.number == 2
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, IO5)
-    assert apdu['ASDU'].IO.balanced
-    assert apdu['ASDU'].IO.IOA == 0x01
-    assert isinstance(apdu['ASDU'].IO.information, list)
-    assert all(isinstance(x, StepPosition) for x in apdu['ASDU'].IO.information)
-    assert all(x == spos for x in apdu['ASDU'].IO.information)
-    assert len(apdu['ASDU'].IO.information) == 2
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x05
+    assert asdu.VSQ.SQ == 1
+    assert asdu.VSQ.number == 2
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, IO5)
+    assert asdu.IO.balanced
+    assert asdu.IO.IOA == 0x01
+    assert isinstance(asdu.IO.information, list)
+    assert all(isinstance(x, StepPosition) for x in asdu.IO.information)
+    assert all(x == spos for x in asdu.IO.information)
+    assert len(asdu.IO.information) == 2
     apdu = APDU(b'\x68\x0d\x02\x00\x02\x00\x05\x81\x03\x01\x01\x00\x00\x01\x00')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 13
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 13
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x05
-    assert apdu['ASDU'].VSQ.SQ == 1
-    assert apdu['ASDU'].VSQ.number == 1
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, IO5)
-    assert not apdu['ASDU'].IO.balanced
-    assert apdu['ASDU'].IO.IOA == 0x01
-    assert isinstance(apdu['ASDU'].IO.information, list)
-    assert all(isinstance(x, StepPosition) for x in apdu['ASDU'].IO.information)
-    assert all(x == spos for x in apdu['ASDU'].IO.information)
-    assert len(apdu['ASDU'].IO.information) == 1
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x05
+    assert asdu.VSQ.SQ == 1
+    assert asdu.VSQ.number == 1
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, IO5)
+    assert not asdu.IO.balanced
+    assert asdu.IO.IOA == 0x01
+    assert isinstance(asdu.IO.information, list)
+    assert all(isinstance(x, StepPosition) for x in asdu.IO.information)
+    assert all(x == spos for x in asdu.IO.information)
+    assert len(asdu.IO.information) == 1
     apdu = APDU(b'\x68\x0f\x02\x00\x02\x00\x05\x82\x03\x01\x01\x00\x00\x01\x00\x01\x00')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 15
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 15
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x05
-    assert apdu['ASDU'].VSQ.SQ == 1
-    assert apdu['ASDU'].VSQ.number == 2
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, IO5)
-    assert not apdu['ASDU'].IO.balanced
-    assert apdu['ASDU'].IO.IOA == 0x01
-    assert isinstance(apdu['ASDU'].IO.information, list)
-    assert all(isinstance(x, StepPosition) for x in apdu['ASDU'].IO.information)
-    assert all(x == spos for x in apdu['ASDU'].IO.information)
-    assert len(apdu['ASDU'].IO.information) == 2
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x05
+    assert asdu.VSQ.SQ == 1
+    assert asdu.VSQ.number == 2
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, IO5)
+    assert not asdu.IO.balanced
+    assert asdu.IO.IOA == 0x01
+    assert isinstance(asdu.IO.information, list)
+    assert all(isinstance(x, StepPosition) for x in asdu.IO.information)
+    assert all(x == spos for x in asdu.IO.information)
+    assert len(asdu.IO.information) == 2
 
 def test_M_ST_TA_1():
     apci : APCI = APCI(type=0x00, Tx=1, Rx=1)
@@ -947,104 +992,112 @@ def test_M_ST_TA_1():
     assert apdu.build() == b'\x68\x18\x02\x00\x02\x00\x06\x02\x03\x01\x01\x00\x00\x01\x00\x39\x30\x25\x02\x00\x00\x01\x00\x39\x30\x25'
     apdu = APDU(b'\x68\x0f\x02\x00\x02\x00\x06\x01\x03\x01\x01\x00\x01\x00\x39\x30\x25')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 15
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 15
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x06
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 1
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO6) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 1
-    assert apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 1
-    assert apdu['ASDU'].IO[0].transient == 0
-    assert apdu['ASDU'].IO[0].value == 1
-    assert apdu['ASDU'].IO[0].QDS == 0x00
-    assert apdu['ASDU'].IO[0].getfieldval('time') == cptime
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x06
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 1
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO6) for x in asdu.IO)
+    assert len(asdu.IO) == 1
+    assert asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 1
+    assert asdu.IO[0].transient == 0
+    assert asdu.IO[0].value == 1
+    assert asdu.IO[0].QDS == 0x00
+    assert asdu.IO[0].getfieldval('time') == cptime
     apdu = APDU(b'\x68\x16\x02\x00\x02\x00\x06\x02\x03\x01\x01\x00\x01\x00\x39\x30\x25\x02\x00\x01\x00\x39\x30\x25')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 22
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 22
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x06
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 2
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO6) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 2
-    assert apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 1
-    assert apdu['ASDU'].IO[0].transient == 0
-    assert apdu['ASDU'].IO[0].value == 1
-    assert apdu['ASDU'].IO[0].QDS == 0x00
-    assert apdu['ASDU'].IO[0].getfieldval('time') == cptime
-    assert apdu['ASDU'].IO[1].balanced
-    assert apdu['ASDU'].IO[1].IOA == 2
-    assert apdu['ASDU'].IO[1].transient == 0
-    assert apdu['ASDU'].IO[1].value == 1
-    assert apdu['ASDU'].IO[1].QDS == 0x00
-    assert apdu['ASDU'].IO[1].getfieldval('time') == cptime
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x06
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 2
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO6) for x in asdu.IO)
+    assert len(asdu.IO) == 2
+    assert asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 1
+    assert asdu.IO[0].transient == 0
+    assert asdu.IO[0].value == 1
+    assert asdu.IO[0].QDS == 0x00
+    assert asdu.IO[0].getfieldval('time') == cptime
+    assert asdu.IO[1].balanced
+    assert asdu.IO[1].IOA == 2
+    assert asdu.IO[1].transient == 0
+    assert asdu.IO[1].value == 1
+    assert asdu.IO[1].QDS == 0x00
+    assert asdu.IO[1].getfieldval('time') == cptime
     apdu = APDU(b'\x68\x10\x02\x00\x02\x00\x06\x01\x03\x01\x01\x00\x00\x01\x00\x39\x30\x25')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 16
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 16
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x06
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 1
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO6) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 1
-    assert not apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 1
-    assert apdu['ASDU'].IO[0].transient == 0
-    assert apdu['ASDU'].IO[0].value == 1
-    assert apdu['ASDU'].IO[0].QDS == 0x00
-    assert apdu['ASDU'].IO[0].getfieldval('time') == cptime
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x06
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 1
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO6) for x in asdu.IO)
+    assert len(asdu.IO) == 1
+    assert not asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 1
+    assert asdu.IO[0].transient == 0
+    assert asdu.IO[0].value == 1
+    assert asdu.IO[0].QDS == 0x00
+    assert asdu.IO[0].getfieldval('time') == cptime
     apdu = APDU(b'\x68\x18\x02\x00\x02\x00\x06\x02\x03\x01\x01\x00\x00\x01\x00\x39\x30\x25\x02\x00\x00\x01\x00\x39\x30\x25')
     assert apdu.haslayer('APCI')
-    assert apdu['APCI'].type == 0x00
-    assert apdu['APCI'].length == 24
-    assert apdu['APCI'].Tx == 1
-    assert apdu['APCI'].Rx == 1
+    apci : APCI = apdu['APCI']
+    assert apci.type == 0x00
+    assert apci.length == 24
+    assert apci.Tx == 1
+    assert apci.Rx == 1
     assert apdu.haslayer('ASDU')
-    assert apdu['ASDU'].type == 0x06
-    assert apdu['ASDU'].VSQ.SQ == 0
-    assert apdu['ASDU'].VSQ.number == 2
-    assert apdu['ASDU'].COT_flags == 0b00
-    assert apdu['ASDU'].COT == 0x03
-    assert apdu['ASDU'].CommonAddress == 0x01
-    assert isinstance(apdu['ASDU'].IO, list)
-    assert all(isinstance(x, IO6) for x in apdu['ASDU'].IO)
-    assert len(apdu['ASDU'].IO) == 2
-    assert not apdu['ASDU'].IO[0].balanced
-    assert apdu['ASDU'].IO[0].IOA == 1
-    assert apdu['ASDU'].IO[0].transient == 0
-    assert apdu['ASDU'].IO[0].value == 1
-    assert apdu['ASDU'].IO[0].QDS == 0x00
-    assert apdu['ASDU'].IO[0].getfieldval('time') == cptime
-    assert not apdu['ASDU'].IO[1].balanced
-    assert apdu['ASDU'].IO[1].IOA == 2
-    assert apdu['ASDU'].IO[1].transient == 0
-    assert apdu['ASDU'].IO[1].value == 1
-    assert apdu['ASDU'].IO[1].QDS == 0x00
-    assert apdu['ASDU'].IO[1].getfieldval('time') == cptime
+    asdu : ASDU = apci['ASDU']
+    assert asdu.type == 0x06
+    assert asdu.VSQ.SQ == 0
+    assert asdu.VSQ.number == 2
+    assert asdu.COT_flags == 0b00
+    assert asdu.COT == 0x03
+    assert asdu.CommonAddress == 0x01
+    assert isinstance(asdu.IO, list)
+    assert all(isinstance(x, IO6) for x in asdu.IO)
+    assert len(asdu.IO) == 2
+    assert not asdu.IO[0].balanced
+    assert asdu.IO[0].IOA == 1
+    assert asdu.IO[0].transient == 0
+    assert asdu.IO[0].value == 1
+    assert asdu.IO[0].QDS == 0x00
+    assert asdu.IO[0].getfieldval('time') == cptime
+    assert not asdu.IO[1].balanced
+    assert asdu.IO[1].IOA == 2
+    assert asdu.IO[1].transient == 0
+    assert asdu.IO[1].value == 1
+    assert asdu.IO[1].QDS == 0x00
+    assert asdu.IO[1].getfieldval('time') == cptime
     
 
 def test_C_SC_NA_1():
@@ -1104,3 +1157,45 @@ def test_C_SC_NA_1():
     assert io.IOA == 4
     assert io.SE == 0
     assert io.SCS == 1
+
+def test_dissected_ASDU_edit():
+    '''
+    Test that changes to a dissected ASDU are built instead of the received bytes
+    '''
+    frame : bytes = b'\x68\x0e\x02\x00\x02\x00\x01\x02\x03\x01\x01\x00\xa1\x02\x00\x01'
+    apdu : APDU = APDU(frame)
+    assert apdu.build() == frame
+    asdu : ASDU = apdu['ASDU']
+    asdu.IO[1].SIQ = 0x00
+    assert apdu.build() == b'\x68\x0e\x02\x00\x02\x00\x01\x02\x03\x01\x01\x00\xa1\x02\x00\x00'
+    apdu = APDU(frame)
+    asdu = apdu['ASDU']
+    asdu.VSQ.number = 3
+    asdu.IO.append(IO1(IOA=3, SIQ=0x01, _balanced=True))
+    assert apdu.build() == b'\x68\x0e\x02\x00\x02\x00\x01\x03\x03\x01\x01\x00\xa1\x02\x00\x01\x03\x00\x01'
+    apdu = APDU(frame)
+    asdu = apdu['ASDU']
+    asdu.COT = 6
+    assert apdu.build() == b'\x68\x0e\x02\x00\x02\x00\x01\x02\x06\x01\x01\x00\xa1\x02\x00\x01'
+
+def test_dissected_ASDU_COT_flags():
+    '''
+    Test that a dissected ASDU holds the cause of transmission flags as a FlagValue
+    '''
+    apdu : APDU = APDU(b'\x68\x0e\x02\x00\x02\x00\x01\x02\x43\x01\x01\x00\xa1\x02\x00\x01')
+    asdu : ASDU = apdu['ASDU']
+    assert isinstance(asdu.getfieldval('COT_flags'), FlagValue)
+    assert asdu.COT_flags == ASDU(COT_flags=0b01).COT_flags
+    assert asdu.COT == 3
+
+def test_truncated_APCI():
+    '''
+    Test that a frame shorter than the APCI fails as an IndexError
+    '''
+    with pytest.raises(IndexError):
+        APDU(b'\x68\x04\x01\x00')
+    with pytest.raises(IndexError):
+        APCI(b'\x68\x04\x02\x00\x02')
+    apci : APCI = APCI(b'\x68\x04\x43\x00')
+    assert apci.type == 0x03
+    assert apci.UType == 0x10
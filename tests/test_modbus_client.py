@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+from socket import socket, socketpair
+
+import pytest
+import scapy.contrib.modbus as smb
+from nefics.protos.modbus import ModbusClient, ModbusMemmap
+from nefics.utils.modbus_client import MBCLI
+
+def _client_pair() -> tuple[ModbusClient, socket]:
+    # The client talks to one end of a socket pair, the test plays the device on the other
+    client : ModbusClient = ModbusClient('127.0.0.1')
+    client._sock.close()
+    client._sock, device = socketpair()
+    client._sock.settimeout(5)
+    return client, device
+
+def _hr_reply(trans_id : int, value : int) -> bytes:
+    return (smb.ModbusADUResponse(transId=trans_id, unitId=1)/smb.ModbusPDU03ReadHoldingRegistersResponse(registerVal=[value])).build()
+
+def _hr_error(trans_id : int, code : int) -> bytes:
+    return (smb.ModbusADUResponse(transId=trans_id, unitId=1)/smb.ModbusPDU03ReadHoldingRegistersError(exceptCode=code)).build()
+
+def test_read_many_pipelined_out_of_order():
+    client, device = _client_pair()
+    device.sendall(_hr_reply(2, 0x0300) + _hr_reply(0, 0x0100) + _hr_reply(1, 0x0200))
+    assert client.read_many_pipelined(ModbusMemmap.HR, [10, 11, 12]) == [0x0100, 0x0200, 0x0300]
+    requests : bytes = device.recv(1024)
+    assert len(requests) == 3 * 12
+    assert [int.from_bytes(requests[i:i + 2], 'big') for i in range(0, len(requests), 12)] == [0, 1, 2]
+    client._sock.close()
+    device.close()
+
+def test_read_many_pipelined_coils():
+    client, device = _client_pair()
+    reply = lambda t, v: (smb.ModbusADUResponse(transId=t, unitId=1)/smb.ModbusPDU01ReadCoilsResponse(coilStatus=[v])).build()
+    device.sendall(reply(1, 0) + reply(0, 1))
+    assert client.read_many_pipelined(ModbusMemmap.CO, [3, 4]) == [True, False]
+    client._sock.close()
+    device.close()
+
+def test_read_many_pipelined_exception():
+    client, device = _client_pair()
+    device.sendall(_hr_reply(1, 0x0200) + _hr_error(0, 0x02) + _hr_reply(2, 0x0300))
+    with pytest.raises(AssertionError) as e:
+        client.read_many_pipelined(ModbusMemmap.HR, [10, 11, 12])
+    assert str(e.value) == 'Modbus exception: 0x02'
+    # The replies after the exception were consumed, so the next request gets its own answer
+    device.sendall(_hr_reply(9, 0x0900))
+    assert client.read_word(ModbusMemmap.HR, 20, transaction=9) == 0x0900
+    client._sock.close()
+    device.close()
+
+def test_read_many_pipelined_repeated_transaction():
+    client, device = _client_pair()
+    device.sendall(_hr_reply(0, 0x0100) + _hr_reply(0, 0x0100) + _hr_reply(2, 0x0300))
+    with pytest.raises(AssertionError) as e:
+        client.read_many_pipelined(ModbusMemmap.HR, [10, 11, 12])
+    assert str(e.value) == 'Unexpected transaction ID (0)'
+    client._sock.close()
+    device.close()
+
+def test_read_many_pipelined_unknown_transaction():
+    client, device = _client_pair()
+    device.sendall(_hr_reply(0, 0x0100) + _hr_reply(7, 0x0700))
+    with pytest.raises(AssertionError) as e:
+        client.read_many_pipelined(ModbusMemmap.HR, [10, 11])
+    assert str(e.value) == 'Unexpected transaction ID (7)'
+    client._sock.close()
+    device.close()
+
+def test_begin_finish_read_word():
+    client, device = _client_pair()
+    transaction : int = client.begin_read_word(ModbusMemmap.IR, 30, 5)
+    assert transaction == 5
+    request : bytes = device.recv(1024)
+    assert request == (smb.ModbusADURequest(transId=5, unitId=1)/smb.ModbusPDU04ReadInputRegistersRequest(startAddr=30, quantity=1)).build()
+    device.sendall((smb.ModbusADUResponse(transId=5, unitId=1)/smb.ModbusPDU04ReadInputRegistersResponse(registerVal=[0x1234])).build())
+    assert client.finish_read_word(transaction) == 0x1234
+    client._sock.close()
+    device.close()
+
+def test_finish_read_word_mismatched_transaction():
+    client, device = _client_pair()
+    transaction : int = client.begin_read_word(ModbusMemmap.HR, 30, 3)
+    device.sendall(_hr_reply(4, 0x0100))
+    with pytest.raises(AssertionError) as e:
+        client.finish_read_word(transaction)
+    assert str(e.value) == 'Unexpected transaction ID (4)'
+    client._sock.close()
+    device.close()
+
+def test_finish_read_word_exception():
+    client, device = _client_pair()
+    transaction : int = client.begin_read_word(ModbusMemmap.HR, 30, 3)
+    device.sendall(_hr_error(3, 0x02))
+    with pytest.raises(AssertionError) as e:
+        client.finish_read_word(transaction)
+    assert str(e.value) == 'Modbus exception: 0x02'
+    client._sock.close()
+    device.close()
+
+@pytest.mark.parametrize('value', ['-5', '-1.5', 'nan', 'inf', '-inf', '1e10', '70000'])
+def test_writehr_invalid_value(value : str, capsys : pytest.CaptureFixture):
+    cli_sock, device = socketpair()
+    cli_sock.settimeout(1)
+    cli : MBCLI = MBCLI(cli_sock)
+    cli.do_writehr(f'10 {value}')
+    assert capsys.readouterr().out == 'Invalid address or value\n'
+    # Nothing was sent to the device
+    device.setblocking(False)
+    with pytest.raises(BlockingIOError):
+        device.recv(1024)
+    cli_sock.close()
+    device.close()
+
+def test_writehr_float():
+    cli_sock, device = socketpair()
+    device.settimeout(5)
+    cli : MBCLI = MBCLI(cli_sock)
+    device.sendall((smb.ModbusADUResponse(transId=1, unitId=1)/smb.ModbusPDU06WriteSingleRegisterResponse(registerAddr=10, registerValue=0x3e00)).build())
+    cli.do_writehr('10 1.5')
+    request = smb.ModbusADURequest(device.recv(1024))
+    assert request.registerAddr == 10
+    assert request.registerValue == 0x3e00
+    cli_sock.close()
+    device.close()
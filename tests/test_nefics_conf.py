@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import pytest
 from netifaces import interfaces
 from run import check_configuration
 
@@ -8,20 +9,31 @@ def test_mandatory_general():
     conf_so = {'switches': []}
     conf_do = {'devices': []}
     conf_ok = {'switches': [], 'devices': []}
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_missing)
-    except AssertionError as e:
-        assert str(e) == f"Missing configuration directives: ['switches', 'devices']"
+    assert str(e.value) == f"Missing configuration directives: ['switches', 'devices']"
     
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_so)
-    except AssertionError as e:
-        assert str(e) == f"Missing configuration directives: ['devices']"
+    assert str(e.value) == f"Missing configuration directives: ['devices']"
     
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_do)
-    except AssertionError as e:
-        assert str(e) == f"Missing configuration directives: ['switches']"
+    assert str(e.value) == f"Missing configuration directives: ['switches']"
+
+    check_configuration(conf_ok)
+
+def test_optional_general():
+    conf_pa = {'switches': [], 'devices': [], 'ping_all': 'yes'}
+    conf_xt = {'switches': [], 'devices': [], 'xterm': 1}
+    conf_ok = {'switches': [], 'devices': [], 'ping_all': True, 'xterm': False}
+    with pytest.raises(AssertionError) as e:
+        check_configuration(conf_pa)
+    assert str(e.value) == '"ping_all" directive must be a boolean.'
+
+    with pytest.raises(AssertionError) as e:
+        check_configuration(conf_xt)
+    assert str(e.value) == '"xterm" directive must be a boolean.'
 
     check_configuration(conf_ok)
 
@@ -33,40 +45,33 @@ def test_switches():
     conf_ni = {'devices': [], 'switches': [{'name': 's1', 'dpid': '1'}]}
     conf_dn = {'devices': [], 'switches': [{'name': 's1'}, {'name': 's1'}]}
     conf_dd = {'devices': [], 'switches': [{'name': 's1', 'dpid': 1}, {'name': 's2', 'dpid': 1}]}
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_nl)
-    except AssertionError as e:
-        assert str(e) == f'"switches" directive must be a list of switch configurations.'
+    assert str(e.value) == f'"switches" directive must be a list of switch configurations.'
     
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_nd)
-    except AssertionError as e:
-        assert str(e) == f"Switch configurations must be dictionaries.\r\nOffending switches: ['switch 1']"
+    assert str(e.value) == f"Switch configurations must be dictionaries.\r\nOffending switches: ['switch 1']"
     
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_nn)
-    except AssertionError as e:
-        assert str(e) == f'Missing "name" in switch configuration'
+    assert str(e.value) == f'Missing "name" in switch configuration'
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_ns)
-    except AssertionError as e:
-        assert str(e) == f'Specified switch "name" value is not a string.\r\nOffending values: [True]'
+    assert str(e.value) == f'Specified switch "name" value is not a string.\r\nOffending values: [True]'
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_ni)
-    except AssertionError as e:
-        assert str(e) == f'Specified switch "dpid" value is not an integer.\r\nOffending values: [\'1\']'
+    assert str(e.value) == f'Specified switch "dpid" value is not an integer.\r\nOffending values: [\'1\']'
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_dn)
-    except AssertionError as e:
-        assert str(e) == f"Duplicate switch names: ['s1']"
+    assert str(e.value) == f"Duplicate switch names: ['s1']"
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_dd)
-    except AssertionError as e:
-        assert str(e) == f'Duplicate switch dpid: [1]'
+    assert str(e.value) == f'Duplicate switch dpid: [1]'
 
 
 def test_devices():
@@ -84,104 +89,87 @@ def test_devices():
     conf_idi = {'switches': [{'name': 's1'}], 'devices': [{'name': 'h1','interfaces': [{'name': 'eth0', 'switch': 's1', 'ip': '10.0.0.1/24'}]}, {'name': 'h2','interfaces': [{'name': 'eth0', 'switch': 's1', 'ip': '10.0.0.1/24'}]}]}
     conf_idm = {'switches': [{'name': 's1'}], 'devices': [{'name': 'h1','interfaces': [{'name': 'eth0', 'switch': 's1', 'ip': '10.0.0.1/24', 'mac': 'aa:bb:cc:dd:ee:ff'},{'name': 'eth1', 'switch': 's1', 'ip': '10.0.0.2/24', 'mac': 'aa:bb:cc:dd:ee:ff'}]}]}
     conf_ok = {'switches': [{'name': 's1'}], 'devices': [{'name': 'h1', 'interfaces': [{'name': 'eth0', 'switch': 's1', 'ip': '10.0.0.1/24', 'mac': 'aa:bb:cc:dd:ee:ff'}]}]}
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_nl)
-    except AssertionError as e:
-        assert str(e) == '"devices" directive must be a list of device configurations.'
+    assert str(e.value) == '"devices" directive must be a list of device configurations.'
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_nd)
-    except AssertionError as e:
-        assert str(e) == "Device configurations must be dictionaries.\r\nOffending devices: ['dummy']"
+    assert str(e.value) == "Device configurations must be dictionaries.\r\nOffending devices: ['dummy']"
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_bd)
-    except AssertionError as e:
-        assert str(e) == "Unrecognized device directives: ['test']"
+    assert str(e.value) == "Unrecognized device directives: ['test']"
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_dd)
-    except AssertionError as e:
-        assert str(e) == "Duplicate device names: ['h1']"
+    assert str(e.value) == "Duplicate device names: ['h1']"
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_inl)
-    except AssertionError as e:
-        assert str(e) == '"Interfaces" directive must be a list of interfaces.\r\nOffending devices: [\'h1\']'
+    assert str(e.value) == '"Interfaces" directive must be a list of interfaces.\r\nOffending devices: [\'h1\']'
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_ind)
-    except AssertionError as e:
-        assert str(e) == "Interface configurations must be dictionaries.\r\nOffending interfaces: ['dummy']"
+    assert str(e.value) == "Interface configurations must be dictionaries.\r\nOffending interfaces: ['dummy']"
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_iud)
-    except AssertionError as e:
-        assert str(e) == 'Unrecognized interface directives: ["dummy in {\'dummy\': \'dummy\'}"]'
+    assert str(e.value) == 'Unrecognized interface directives: ["dummy in {\'dummy\': \'dummy\'}"]'
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_imd)
-    except AssertionError as e:
-        assert str(e) == 'Missing required interface directives: ["ip in {\'name\': \'eth0\'}", "switch in {\'name\': \'eth0\'}"]'
+    assert str(e.value) == 'Missing required interface directives: ["ip in {\'name\': \'eth0\'}", "switch in {\'name\': \'eth0\'}"]'
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_ius)
-    except AssertionError as e:
-        assert str(e) == "Specified switch has not been defined: ['dummy']"
+    assert str(e.value) == "Specified switch has not been defined: ['dummy']"
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_ibi)
-    except AssertionError as e:
-        assert str(e) == "Bad IPv4: ['300.0.0.0/99']"
+    assert str(e.value) == "Bad IPv4: ['300.0.0.0/99']"
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_idn)
-    except AssertionError as e:
-        assert str(e) == "Duplicate interface names: {'h1': ['eth0']}"
+    assert str(e.value) == "Duplicate interface names: {'h1': ['eth0']}"
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_idi)
-    except AssertionError as e:
-        assert str(e) == "Duplicate IP addresses: ['10.0.0.1/24']"
+    assert str(e.value) == "Duplicate IP addresses: ['10.0.0.1/24']"
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_idm)
-    except AssertionError as e:
-        assert str(e) == "Duplicate MAC addresses: ['aa:bb:cc:dd:ee:ff']"
+    assert str(e.value) == "Duplicate MAC addresses: ['aa:bb:cc:dd:ee:ff']"
 
     check_configuration(conf_ok)
 
 
 def test_localiface():
+    iface = interfaces()[0]
     conf_nd = {'switches': [], 'devices': [], 'localiface': 'dummy'}
     conf_ud = {'switches': [], 'devices': [], 'localiface': {'dummy': 'dummy'}}
     conf_ns = {'switches': [], 'devices': [], 'localiface': {'iface': 0, 'switch': 's1'}}
     conf_ui = {'switches': [], 'devices': [], 'localiface': {'iface': 'test', 'switch': 's1'}}
-    conf_us = {'switches': [{'name': 's1', 'dpid': 1}], 'devices': [], 'localiface': {'iface': interfaces()[0], 'switch': 's2'}}
-    conf_ok = {'switches': [{'name': 's1', 'dpid': 1}], 'devices': [], 'localiface': {'iface': interfaces()[0], 'switch': 's1'}}
-    try:
+    conf_us = {'switches': [{'name': 's1', 'dpid': 1}], 'devices': [], 'localiface': {'iface': iface, 'switch': 's2'}}
+    conf_ok = {'switches': [{'name': 's1', 'dpid': 1}], 'devices': [], 'localiface': {'iface': iface, 'switch': 's1'}}
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_nd)
-    except AssertionError as e:
-        assert str(e) == 'Local interface configuration must be a dictionary.'
+    assert str(e.value) == 'Local interface configuration must be a dictionary.'
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_ud)
-    except AssertionError as e:
-        assert str(e) == "Unknown local interface directives: ['dummy']"
+    assert str(e.value) == "Unknown local interface directives: ['dummy']"
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_ns)
-    except AssertionError as e:
-        assert str(e) == 'Local interface value is not a string: [0]'
+    assert str(e.value) == 'Local interface value is not a string: [0]'
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_ui)
-    except AssertionError as e:
-        assert str(e) == 'Cannot find local interface: test'
+    assert str(e.value) == 'Cannot find local interface: test'
 
-    try:
+    with pytest.raises(AssertionError) as e:
         check_configuration(conf_us)
-    except AssertionError as e:
-        assert str(e) == 'Specified switch has not been defined: s2'
+    assert str(e.value) == 'Specified switch has not been defined: s2'
 
     check_configuration(conf_ok)
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+
+import pytest
+from nefics.utils.watertank_attack import valid_ipv4
+
+@pytest.mark.parametrize('ip_addr', ['192.168.0.1', '10.0.0.254', '0.0.0.0', '255.255.255.255'])
+def test_valid_ipv4_accepts(ip_addr : str):
+    assert valid_ipv4(ip_addr)
+
+# Shorthand forms accepted by socket.inet_aton ('127.1', '1', '0x7f.0.0.1') are rejected
+@pytest.mark.parametrize('ip_addr', ['256.1.1.1', '1.2.3', '127.1', '1', '0x7f.0.0.1', '1.2.3.4/24', '1.2.3.4 ', '', 'localhost', '::1'])
+def test_valid_ipv4_rejects(ip_addr : str):
+    assert not valid_ipv4(ip_addr)